@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Stream published assets one at a time from a data.json snapshot or API response
+"""
+
+import codecs
+import gzip
+import json
+import time
+from datetime import datetime
+
+import instrumentation
+
+# Fields that carry large prompt/text blobs and are never read by the stats views
+HEAVY_FIELDS = ("settings.metadata", "description", "dominant_colors")
+
+CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARS = frozenset("0123456789+-.eE")
+_decoder = json.JSONDecoder()
+
+
+class _ChunkBuffer:
+    """Text buffer that pulls more chunks from the source only when needed"""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self):
+        """Append the next chunk, dropping everything already consumed"""
+        if self.eof:
+            return False
+
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self.eof = True
+            chunk = self._utf8.decode(b"", final=True)
+        else:
+            instrumentation.count("bytes_read", len(chunk))
+            if isinstance(chunk, bytes):
+                chunk = self._utf8.decode(chunk)
+
+        self.text = self.text[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Return the next non-whitespace character (or '' at end of input)"""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, char):
+        """Consume a single structural character"""
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected '{char}' in asset snapshot, found '{found}'")
+        self.pos += 1
+
+    def decode_value(self):
+        """Decode one complete JSON value, reading more chunks if it is truncated"""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+
+            # A number followed by nothing, or only by the start of a fraction or
+            # exponent ("1." / "1e-"), may continue in the next chunk
+            if (
+                not self.eof
+                and isinstance(value, (int, float))
+                and not isinstance(value, bool)
+                and all(c in _NUMBER_CHARS for c in self.text[end:])
+            ):
+                self.fill()
+                continue
+
+            self.pos = end
+            return value
+
+
+def strip_fields(asset, fields):
+    """Remove dotted-path fields like 'settings.metadata' from an asset in place"""
+    for field in fields:
+        *parents, leaf = field.split(".")
+        target = asset
+        for key in parents:
+            target = target.get(key) if isinstance(target, dict) else None
+        if isinstance(target, dict):
+            target.pop(leaf, None)
+    return asset
+
+
+def parse_timestamp(value):
+    """Convert an API timestamp like '2025-11-15T05:45:41.716152Z' to epoch seconds"""
+    if not value:
+        return 0.0
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+
+
+def _iter_array(buffer, skip_fields):
+    """Yield the elements of a JSON array whose '[' has not been consumed yet"""
+    buffer.expect("[")
+    if buffer.peek() == "]":
+        buffer.pos += 1
+        return
+
+    timed = instrumentation.enabled
+    while True:
+        if timed:
+            started = time.perf_counter()
+            asset = buffer.decode_value()
+            instrumentation.add_time("decode", time.perf_counter() - started)
+        else:
+            asset = buffer.decode_value()
+        if skip_fields and isinstance(asset, dict):
+            strip_fields(asset, skip_fields)
+        yield asset
+
+        if buffer.peek() == ",":
+            buffer.pos += 1
+            continue
+        buffer.expect("]")
+        return
+
+
+def iter_assets(chunks, skip_fields=()):
+    """
+    Yield assets one by one from an iterable of str/bytes chunks.
+
+    Accepts either the full /published payload ({"assets": [...], ...}) or a
+    bare list of assets. Only one asset is held in memory at a time.
+    """
+    buffer = _ChunkBuffer(chunks)
+    first = buffer.peek()
+
+    if first == "[":
+        yield from _iter_array(buffer, skip_fields)
+        return
+
+    buffer.expect("{")
+    if buffer.peek() == "}":
+        return
+
+    while True:
+        key = buffer.decode_value()
+        buffer.expect(":")
+
+        if key == "assets":
+            yield from _iter_array(buffer, skip_fields)
+        else:
+            # Other top-level values ("status", ...) are small, just skip them
+            buffer.decode_value()
+
+        if buffer.peek() == ",":
+            buffer.pos += 1
+            continue
+        buffer.expect("}")
+        return
+
+
+def _read_chunks(f, chunk_size=CHUNK_SIZE):
+    """Read a file object in fixed-size chunks"""
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_assets_from_file(path, skip_fields=()):
+    """Yield assets from a snapshot file shaped like data.json (.gz is fine too)"""
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rb") as f:
+        yield from iter_assets(_read_chunks(f), skip_fields)
+
+
+def iter_assets_from_response(response, skip_fields=()):
+    """Yield assets from a requests response opened with stream=True"""
+    try:
+        yield from iter_assets(response.iter_content(CHUNK_SIZE), skip_fields)
+    finally:
+        response.close()
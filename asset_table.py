@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Columnar, NumPy-backed table of published assets for vectorized profile analytics
+"""
+
+import numpy as np
+
+from asset_loader import HEAVY_FIELDS, iter_assets_from_file, parse_timestamp
+
+NUMERIC_COLUMNS = ("id", "favorites", "views", "downloads", "bookmarks")
+TEXT_COLUMNS = ("uuid", "title", "category")
+
+
+class AssetTable:
+    """
+    Assets stored column by column instead of one dict per asset.
+
+    Numeric fields are int64 arrays, `created_at` is a float64 epoch array and
+    text fields are dictionary-encoded (int32 codes into a list of values).
+    """
+
+    def __init__(self, numeric, created_at, codes, dictionaries):
+        self.numeric = numeric
+        self.created_at = created_at
+        self.codes = codes
+        self.dictionaries = dictionaries
+
+    @classmethod
+    def from_assets(cls, assets):
+        """Build a table from any iterable of asset dicts in a single pass"""
+        numeric = {name: [] for name in NUMERIC_COLUMNS}
+        created_at = []
+        codes = {name: [] for name in TEXT_COLUMNS}
+        lookups = {name: {} for name in TEXT_COLUMNS}
+
+        for asset in assets:
+            for name in NUMERIC_COLUMNS:
+                numeric[name].append(asset.get(name) or 0)
+            created_at.append(parse_timestamp(asset.get("created_at")))
+            for name in TEXT_COLUMNS:
+                lookup = lookups[name]
+                value = asset.get(name) or ""
+                code = lookup.get(value)
+                if code is None:
+                    code = lookup[value] = len(lookup)
+                codes[name].append(code)
+
+        return cls(
+            {name: np.asarray(values, dtype=np.int64) for name, values in numeric.items()},
+            np.asarray(created_at, dtype=np.float64),
+            {name: np.asarray(values, dtype=np.int32) for name, values in codes.items()},
+            # dicts keep insertion order, so list position == code
+            {name: list(lookup) for name, lookup in lookups.items()},
+        )
+
+    @classmethod
+    def from_file(cls, path):
+        """Build a table from a snapshot file like data.json, streaming it"""
+        return cls.from_assets(iter_assets_from_file(path, skip_fields=HEAVY_FIELDS))
+
+    def __len__(self):
+        return len(self.created_at)
+
+    def column(self, name):
+        """Return a numeric column (or 'created_at') as a NumPy array"""
+        if name == "created_at":
+            return self.created_at
+        return self.numeric[name]
+
+    def text(self, name, rows=None):
+        """Decode a dictionary-encoded text column, optionally for some rows only"""
+        codes = self.codes[name] if rows is None else self.codes[name][rows]
+        values = self.dictionaries[name]
+        return [values[code] for code in codes]
+
+    def row(self, index):
+        """Return one row as a plain dict (for display)"""
+        row = {name: int(self.numeric[name][index]) for name in NUMERIC_COLUMNS}
+        for name in TEXT_COLUMNS:
+            row[name] = self.dictionaries[name][self.codes[name][index]]
+        row["created_at"] = float(self.created_at[index])
+        return row
+
+    def totals(self, metrics=NUMERIC_COLUMNS[1:]):
+        """Sum each metric column"""
+        return {metric: int(self.numeric[metric].sum()) for metric in metrics}
+
+    def ratio(self, numerator, denominator):
+        """Element-wise numerator/denominator, 0.0 where the denominator is 0"""
+        num = self.column(numerator).astype(np.float64)
+        den = self.column(denominator).astype(np.float64)
+        out = np.zeros(len(self), dtype=np.float64)
+        np.divide(num, den, out=out, where=den != 0)
+        return out
+
+    def top_k(self, metric, top_n=10):
+        """
+        Return row indices of the top_n rows by metric, best first.
+
+        `metric` is a column name or a precomputed array (e.g. from ratio()).
+        Uses argpartition so only the top_n candidates get sorted; ties keep
+        input order like a stable sort.
+        """
+        values = self.column(metric) if isinstance(metric, str) else metric
+        n = len(values)
+        if top_n <= 0 or n == 0:
+            return np.empty(0, dtype=np.intp)
+
+        if top_n < n:
+            candidates = np.argpartition(-values, top_n - 1)[:top_n]
+            # Pull in every row tied with the cut-off so ties resolve by index
+            cutoff = values[candidates].min()
+            candidates = np.flatnonzero(values >= cutoff)
+        else:
+            candidates = np.arange(n)
+
+        order = np.lexsort((candidates, -values[candidates]))
+        return candidates[order][:top_n]
+
+    def group_by(self, key, metrics=NUMERIC_COLUMNS[1:]):
+        """
+        Per-group count and metric sums for a dictionary-encoded column.
+
+        Returns {group_value: {"count": n, metric: sum, ...}} using bincount,
+        so it is one vectorized pass per metric regardless of group count.
+        """
+        codes = self.codes[key]
+        groups = self.dictionaries[key]
+        size = len(groups)
+        counts = np.bincount(codes, minlength=size)
+        sums = {
+            metric: np.bincount(codes, weights=self.numeric[metric], minlength=size)
+            for metric in metrics
+        }
+
+        result = {}
+        for code, value in enumerate(groups):
+            row = {"count": int(counts[code])}
+            for metric in metrics:
+                row[metric] = int(sums[metric][code])
+            result[value] = row
+        return result
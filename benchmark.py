@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark for the analytics path on synthetic data.json-shaped snapshots
+
+Usage:
+  python3 benchmark.py                          run 10k, 100k and 1M assets
+                                                (1M full-schema assets is ~4 GB on disk)
+  python3 benchmark.py --sizes 1000 10000       run custom sizes
+  python3 benchmark.py --compare old.json new.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+import uuid as uuid_lib
+from datetime import datetime, timedelta, timezone
+
+BENCH_DIR = "bench_results"
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+TEMPLATE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data.json")
+
+
+def iter_synthetic_assets(size, template_file=TEMPLATE_FILE, seed=0):
+    """
+    Yield `size` synthetic assets shaped like template_file.
+
+    Assets are cloned from the template with fresh ids/uuids, timestamps and
+    long-tailed counters; the same seed always yields the same assets.
+    """
+    # Imported lazily so the --compare path does not need the analytics modules
+    from asset_loader import iter_assets_from_file
+
+    templates = list(iter_assets_from_file(template_file))
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    for i in range(size):
+        asset = dict(rng.choice(templates))
+        asset_uuid = str(uuid_lib.UUID(int=rng.getrandbits(128), version=4))
+        created = start + timedelta(seconds=rng.randrange(0, 700 * 86400))
+
+        asset["id"] = 100_000_000 + i
+        asset["uuid"] = asset_uuid
+        asset["created_at"] = created.isoformat().replace("+00:00", "Z")
+        asset["updated_at"] = asset["created_at"]
+        # Pareto-ish tails: most posts get little, a few get a lot
+        asset["views"] = int(rng.paretovariate(1.2) * 3)
+        asset["favorites"] = int(asset["views"] * rng.random() * 0.3)
+        asset["downloads"] = int(asset["views"] * rng.random() * 0.1)
+        asset["bookmarks"] = int(asset["favorites"] * rng.random() * 0.2)
+        yield asset
+
+
+def generate_snapshot(path, size, template_file=TEMPLATE_FILE, seed=0):
+    """Write a synthetic snapshot of `size` assets, one by one so memory stays flat"""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{"assets":[')
+        for i, asset in enumerate(iter_synthetic_assets(size, template_file, seed)):
+            if i:
+                f.write(",")
+            json.dump(asset, f, ensure_ascii=False, separators=(",", ":"))
+        f.write('],"status":"success"}')
+
+
+def _timed(results, stage, func, *args):
+    started = time.perf_counter()
+    value = func(*args)
+    results[stage] = round(time.perf_counter() - started, 6)
+    return value
+
+
+def run_size(path):
+    """Time every stage over one snapshot file (runs in a fresh process)"""
+    from asset_loader import HEAVY_FIELDS, iter_assets_from_file
+    from extract_top_posts import get_top_liked_and_viewed
+    from profile_stats import display_top_posts, get_top_by_likes, get_top_by_views
+    from top_k import DEFAULT_METRICS, aggregate
+
+    timings = {}
+    assets = _timed(
+        timings, "load", lambda: list(iter_assets_from_file(path, HEAVY_FIELDS))
+    )
+    _timed(timings, "aggregate", aggregate, assets, DEFAULT_METRICS, 10)
+    _timed(
+        timings,
+        "top_k",
+        lambda: (
+            get_top_by_likes(assets, 10),
+            get_top_by_views(assets, 10),
+            get_top_liked_and_viewed(assets, 50),
+        ),
+    )
+
+    def render(source):
+        with contextlib.redirect_stdout(io.StringIO()):
+            display_top_posts(source, "benchmark", top_n=10)
+
+    _timed(timings, "render", render, assets)
+    # End-to-end streaming report straight from the file, as profile_stats runs it
+    _timed(timings, "stream_report", render, iter_assets_from_file(path, HEAVY_FIELDS))
+
+    # ru_maxrss is KB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        peak //= 1024
+    return {"assets": len(assets), "timings": timings, "peak_rss_kb": peak}
+
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run_benchmarks(sizes, bench_dir=BENCH_DIR):
+    """Generate (or reuse) a snapshot per size and benchmark each in a subprocess"""
+    os.makedirs(bench_dir, exist_ok=True)
+    report = {
+        "revision": _git_revision(),
+        "python": sys.version.split()[0],
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "results": {},
+    }
+
+    for size in sizes:
+        path = os.path.join(bench_dir, f"synthetic_{size}.json")
+        if not os.path.exists(path):
+            print(f"🛠️  Generating {size:,} synthetic assets...")
+            generate_snapshot(path, size)
+
+        # A fresh interpreter per size keeps peak RSS numbers independent
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--run-one", path],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        result = json.loads(output)
+        report["results"][str(size)] = result
+
+        stages = "  ".join(f"{k}={v * 1000:,.1f}ms" for k, v in result["timings"].items())
+        print(f"📊 {size:>9,}: {stages}  peak={result['peak_rss_kb'] / 1024:,.1f}MB")
+
+    out_path = os.path.join(bench_dir, f"bench-{report['revision']}-{int(time.time())}.json")
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"💾 Results saved to {out_path}")
+    return report
+
+
+def compare(old_path, new_path):
+    """Print per-stage ratios between two saved benchmark runs"""
+    with open(old_path, "r", encoding="utf-8") as f:
+        old = json.load(f)
+    with open(new_path, "r", encoding="utf-8") as f:
+        new = json.load(f)
+
+    print(f"\n🔍 {old['revision']} -> {new['revision']}")
+    for size, new_result in new["results"].items():
+        old_result = old["results"].get(size)
+        if not old_result:
+            continue
+        print(f"\n   {int(size):,} assets")
+        for stage, new_time in new_result["timings"].items():
+            old_time = old_result["timings"].get(stage)
+            if not old_time:
+                continue
+            ratio = new_time / old_time
+            flag = "⚠️ " if ratio > 1.10 else "  "
+            print(f"   {flag}{stage:<14} {old_time * 1000:>10,.1f}ms -> {new_time * 1000:>10,.1f}ms  ({ratio:.2f}x)")
+        old_rss, new_rss = old_result["peak_rss_kb"], new_result["peak_rss_kb"]
+        print(f"     {'peak_rss':<14} {old_rss / 1024:>10,.1f}MB -> {new_rss / 1024:>10,.1f}MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"))
+    parser.add_argument("--run-one", metavar="SNAPSHOT", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_one:
+        print(json.dumps(run_size(args.run_one)))
+    elif args.compare:
+        compare(*args.compare)
+    else:
+        run_benchmarks(args.sizes)
+
+
+if __name__ == "__main__":
+    main()
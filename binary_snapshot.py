@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Binary snapshot format: fixed-width metric records + offsets-indexed text side file
+
+A snapshot `name` is two files:
+  name.metrics  header + one fixed-width record per asset (ids, counters,
+                created_at, uuid and offsets into the text file)
+  name.text     UTF-8 titles and the full asset JSON, addressed by offset
+
+Rankings only touch name.metrics (memory-mapped) and the titles of the rows
+they display; prompts and metadata are never deserialized.
+
+Usage:
+  python3 binary_snapshot.py data.json data.snap     convert a JSON snapshot
+  python3 binary_snapshot.py --bench data.json       compare against the JSON path
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+
+from asset_loader import iter_assets_from_file, parse_timestamp
+from top_k import aggregate
+
+MAGIC = b"IMGSNAP\x01"
+HEADER = struct.Struct("<8sQ")
+
+# id, favorites, views, downloads, bookmarks, created_at, uuid,
+# title offset/length, asset JSON offset/length
+RECORD = struct.Struct("<5qd36sQIQI")
+RECORD_FIELDS = (
+    "id",
+    "favorites",
+    "views",
+    "downloads",
+    "bookmarks",
+    "created_at",
+    "uuid",
+    "title_offset",
+    "title_length",
+    "blob_offset",
+    "blob_length",
+)
+
+# NumPy and the matching record dtype, imported on first use by _numpy()
+np = None
+RECORD_DTYPE = None
+
+
+def _numpy():
+    """Import NumPy lazily (it dominates startup); None if it is not installed"""
+    global np, RECORD_DTYPE
+    if np is None:
+        try:
+            import numpy
+        except ImportError:  # column() falls back to plain lists
+            np = False
+            return None
+        RECORD_DTYPE = numpy.dtype(
+            {
+                "names": list(RECORD_FIELDS),
+                "formats": ["<i8"] * 5 + ["<f8", "S36", "<u8", "<u4", "<u8", "<u4"],
+                "offsets": [0, 8, 16, 24, 32, 40, 48, 84, 92, 96, 104],
+                "itemsize": RECORD.size,
+            }
+        )
+        np = numpy
+    return np or None
+
+
+def snapshot_files(path):
+    """
+    Accept 'name', 'name.metrics' or 'name.text' and return the
+    (metrics_path, text_path) pair; the .metrics file stands for the
+    snapshot's size and mtime.
+    """
+    base, ext = os.path.splitext(path)
+    if ext not in (".metrics", ".text"):
+        base = path
+    return base + ".metrics", base + ".text"
+
+
+def is_binary_snapshot(path):
+    """True if path names a snapshot written by write_snapshot"""
+    metrics_path, text_path = snapshot_files(path)
+    if not (os.path.isfile(metrics_path) and os.path.isfile(text_path)):
+        return False
+    with open(metrics_path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def write_snapshot(assets, path):
+    """Write any iterable of assets as a binary snapshot, returning the count"""
+    metrics_path, text_path = snapshot_files(path)
+    count = 0
+    text_offset = 0
+
+    with open(metrics_path, "wb") as metrics, open(text_path, "wb") as text:
+        metrics.write(HEADER.pack(MAGIC, 0))
+
+        for asset in assets:
+            title = (asset.get("title") or "").encode("utf-8")
+            blob = json.dumps(asset, ensure_ascii=False, separators=(",", ":")).encode(
+                "utf-8"
+            )
+            text.write(title)
+            text.write(blob)
+
+            metrics.write(
+                RECORD.pack(
+                    asset.get("id") or 0,
+                    asset.get("favorites") or 0,
+                    asset.get("views") or 0,
+                    asset.get("downloads") or 0,
+                    asset.get("bookmarks") or 0,
+                    parse_timestamp(asset.get("created_at")),
+                    (asset.get("uuid") or "").encode("ascii"),
+                    text_offset,
+                    len(title),
+                    text_offset + len(title),
+                    len(blob),
+                )
+            )
+            text_offset += len(title) + len(blob)
+            count += 1
+
+        # Patch the record count into the header now that it is known
+        metrics.seek(0)
+        metrics.write(HEADER.pack(MAGIC, count))
+
+    return count
+
+
+def convert_json_snapshot(json_path, path):
+    """Convert a data.json-style file to a binary snapshot, streaming it"""
+    return write_snapshot(iter_assets_from_file(json_path), path)
+
+
+class BinarySnapshot:
+    """Read-only, memory-mapped view of a binary snapshot"""
+
+    def __init__(self, path):
+        metrics_path, text_path = snapshot_files(path)
+        self._files = [open(metrics_path, "rb"), open(text_path, "rb")]
+        self._metrics = self._map(self._files[0])
+        self._text = self._map(self._files[1])
+
+        magic, self.count = HEADER.unpack_from(self._metrics, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{metrics_path} is not a binary asset snapshot")
+
+    @staticmethod
+    def _map(f):
+        # mmap cannot map empty files; an empty snapshot reads as empty bytes
+        if os.fstat(f.fileno()).st_size == 0:
+            return b""
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def close(self):
+        for mapped in (self._metrics, self._text):
+            if isinstance(mapped, mmap.mmap):
+                try:
+                    mapped.close()
+                except BufferError:
+                    # A record_array() view is still alive; the GC unmaps it later
+                    pass
+        for f in self._files:
+            f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+    def records(self):
+        """Iterate raw record tuples (see RECORD_FIELDS) straight from the mmap"""
+        end = HEADER.size + self.count * RECORD.size
+        return RECORD.iter_unpack(self._metrics[HEADER.size : end])
+
+    def record_array(self):
+        """All records as a NumPy structured array, zero-copy over the mmap"""
+        if _numpy() is None:
+            raise RuntimeError("NumPy is not installed")
+        return np.frombuffer(
+            self._metrics, dtype=RECORD_DTYPE, count=self.count, offset=HEADER.size
+        )
+
+    def column(self, name):
+        """One record field for every asset (NumPy array if available)"""
+        if _numpy() is not None:
+            return self.record_array()[name]
+        index = RECORD_FIELDS.index(name)
+        return [record[index] for record in self.records()]
+
+    def title(self, offset, length):
+        return self._text[offset : offset + length].decode("utf-8")
+
+    def iter_assets(self):
+        """
+        Yield light asset dicts (counters, uuid, title) without touching the
+        asset JSON, so they can feed display_top_posts / top_k directly.
+        """
+        title = self.title
+        for rec in self.records():
+            yield {
+                "id": rec[0],
+                "favorites": rec[1],
+                "views": rec[2],
+                "downloads": rec[3],
+                "bookmarks": rec[4],
+                "uuid": rec[6].decode("ascii"),
+                "title": title(rec[7], rec[8]),
+            }
+
+    def asset(self, index):
+        """Decode the full original asset (prompts included) for one row"""
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        rec = RECORD.unpack_from(self._metrics, HEADER.size + index * RECORD.size)
+        return json.loads(self._text[rec[9] : rec[9] + rec[10]])
+
+    def iter_full_assets(self):
+        """Yield every original asset, e.g. to export back to JSON"""
+        for rec in self.records():
+            yield json.loads(self._text[rec[9] : rec[9] + rec[10]])
+
+
+def iter_snapshot_assets(path):
+    """Yield light assets from a binary snapshot file, closing it when done"""
+    with BinarySnapshot(path) as snapshot:
+        yield from snapshot.iter_assets()
+
+
+def benchmark(json_path, repeat=5):
+    """Time top-k over the JSON snapshot vs. the converted binary snapshot"""
+    base = json_path + ".bench"
+    convert_json_snapshot(json_path, base)
+    metrics = ("favorites", "views", "downloads")
+
+    def json_path_run():
+        with open(json_path, "r", encoding="utf-8") as f:
+            assets = json.load(f).get("assets", [])
+        return aggregate(assets, metrics, 10)
+
+    def binary_path_run():
+        with BinarySnapshot(base) as snapshot:
+            return aggregate(snapshot.iter_assets(), metrics, 10)
+
+    results = {}
+    for label, run in (("json", json_path_run), ("binary", binary_path_run)):
+        best = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            stats = run()
+            best = min(best, time.perf_counter() - started)
+        results[label] = best
+        print(f"   {label:<8} {best * 1000:8.2f} ms  ({stats.count} assets)")
+
+    for path in snapshot_files(base):
+        os.remove(path)
+    print(f"   speedup  {results['json'] / results['binary']:8.1f}x")
+    return results
+
+
+def main():
+    args = sys.argv[1:]
+    if len(args) == 2 and args[0] == "--bench":
+        print(f"\n⏱️  Benchmarking top-k over {args[1]}")
+        benchmark(args[1])
+        return
+    if len(args) != 2:
+        print(__doc__)
+        return
+
+    started = time.perf_counter()
+    count = convert_json_snapshot(args[0], args[1])
+    elapsed = time.perf_counter() - started
+    metrics_path, text_path = snapshot_files(args[1])
+    print(f"✅ Converted {count} assets in {elapsed:.2f}s")
+    print(f"   {metrics_path}: {os.path.getsize(metrics_path):,} bytes")
+    print(f"   {text_path}: {os.path.getsize(text_path):,} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Engagement ratios and per-day velocities, computed once per snapshot and cached
+
+Derived metrics per asset:
+  favorites_per_view       favorites / views
+  downloads_per_view       downloads / views
+  bookmarks_per_favorite   bookmarks / favorites
+  favorites_per_day        favorites / days online
+  views_per_day            views / days online
+
+"Days online" runs from an asset's created_at to the newest created_at or
+updated_at in the same snapshot (the closest thing a dump has to a capture
+time), and is at least one day.
+
+The values are cached under .snapshot_cache/derived/ (one file per snapshot
+path, never next to the snapshot itself) and rebuilt only when the
+snapshot's size or mtime changes. If the cache cannot be written the
+values are simply recomputed next time.
+
+Usage:
+  python3 derived_metrics.py data.json [metric]
+"""
+
+import hashlib
+import json
+import os
+import sys
+
+from asset_loader import HEAVY_FIELDS, iter_assets_from_file, parse_timestamp
+from binary_snapshot import BinarySnapshot, is_binary_snapshot, snapshot_files
+from top_k import aggregate
+
+DERIVED_METRICS = (
+    "favorites_per_view",
+    "downloads_per_view",
+    "bookmarks_per_favorite",
+    "favorites_per_day",
+    "views_per_day",
+)
+
+# Kept inside the snapshot cache so directory scans never mistake it for a snapshot
+CACHE_DIR = os.path.join(".snapshot_cache", "derived")
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+
+def _ratio(numerator, denominator):
+    return round(numerator / denominator, 4) if denominator else 0.0
+
+
+def _fingerprint(path):
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _source_file(path):
+    """The file whose size and mtime identify a JSON or binary snapshot"""
+    return snapshot_files(path)[0] if is_binary_snapshot(path) else path
+
+
+def cache_path(snapshot_path, cache_dir=CACHE_DIR):
+    """Cache file for a snapshot, named after a hash of its absolute path"""
+    key = hashlib.sha1(os.path.abspath(_source_file(snapshot_path)).encode()).hexdigest()
+    return os.path.join(cache_dir, key[:20] + ".json")
+
+
+def _iter_source(path):
+    """Full assets (timestamps included) from a JSON or binary snapshot"""
+    if is_binary_snapshot(path):
+        with BinarySnapshot(path) as snapshot:
+            yield from snapshot.iter_full_assets()
+    else:
+        yield from iter_assets_from_file(path, skip_fields=HEAVY_FIELDS)
+
+
+class DerivedMetrics:
+    """Derived metric values for one snapshot, keyed by asset uuid"""
+
+    def __init__(self, values, reference, source=None):
+        self.values = values
+        self.reference = reference
+        self.source = source
+        self._zeros = [0.0] * len(DERIVED_METRICS)
+
+    @classmethod
+    def build(cls, assets, source=None):
+        """Compute every derived metric in one pass over the counters"""
+        rows = []
+        reference = 0.0
+        for asset in assets:
+            created = parse_timestamp(asset.get("created_at"))
+            updated = parse_timestamp(asset.get("updated_at"))
+            reference = max(reference, created, updated)
+            rows.append(
+                (
+                    asset.get("uuid"),
+                    asset.get("favorites") or 0,
+                    asset.get("views") or 0,
+                    asset.get("downloads") or 0,
+                    asset.get("bookmarks") or 0,
+                    created,
+                )
+            )
+
+        values = {}
+        for uuid, favorites, views, downloads, bookmarks, created in rows:
+            if uuid is None:
+                continue
+            days = max((reference - created) / SECONDS_PER_DAY, 1.0) if created else 0.0
+            values[uuid] = [
+                _ratio(favorites, views),
+                _ratio(downloads, views),
+                _ratio(bookmarks, favorites),
+                _ratio(favorites, days),
+                _ratio(views, days),
+            ]
+        return cls(values, reference, source)
+
+    def save(self, path):
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "source": self.source,
+                    "metrics": DERIVED_METRICS,
+                    "reference": self.reference,
+                    "values": self.values,
+                },
+                f,
+                separators=(",", ":"),
+            )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """Read a cache file; None if it is unreadable or from another version"""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if tuple(data.get("metrics", ())) != DERIVED_METRICS:
+            return None
+        return cls(data["values"], data["reference"], data["source"])
+
+    def keys(self, metrics=DERIVED_METRICS):
+        """Key functions for TopK / aggregate(keys=...), one per derived metric"""
+        values, zeros = self.values, self._zeros
+
+        def key_for(index):
+            return lambda asset: values.get(asset.get("uuid"), zeros)[index]
+
+        return {
+            metric: key_for(DERIVED_METRICS.index(metric))
+            for metric in metrics
+            if metric in DERIVED_METRICS
+        }
+
+
+def load_or_build(snapshot_path, cache_dir=CACHE_DIR):
+    """Load the cached derived metrics, recomputing them if the snapshot changed"""
+    fingerprint = _fingerprint(_source_file(snapshot_path))
+    path = cache_path(snapshot_path, cache_dir)
+
+    derived = DerivedMetrics.load(path) if os.path.exists(path) else None
+    if derived is not None and derived.source == fingerprint:
+        return derived
+
+    derived = DerivedMetrics.build(_iter_source(snapshot_path), fingerprint)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        derived.save(path)
+    except OSError:
+        # Read-only or full disk: the values are still correct, just not cached
+        pass
+    return derived
+
+
+def main():
+    args = sys.argv[1:]
+    if not args or len(args) > 2 or (len(args) == 2 and args[1] not in DERIVED_METRICS):
+        print(__doc__)
+        return
+
+    metric = args[1] if len(args) == 2 else DERIVED_METRICS[0]
+    derived = load_or_build(args[0])
+    stats = aggregate(_iter_source(args[0]), (metric,), 10, derived.keys((metric,)))
+
+    print(f"\n📐 TOP 10 BY {metric.upper()} ({len(derived.values)} assets)")
+    print("-" * 80)
+    for i, (value, asset) in enumerate(stats.top_with_values(metric), 1):
+        print(f"{i:<4} {asset.get('title', 'Untitled')[:48]:<50} {value:>12,.4f}")
+    print("-" * 80)
+
+
+if __name__ == "__main__":
+    main()
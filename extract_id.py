@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
 """
-Fetch UUIDs from API and add new ones to index.py POST_IDS array
+Fetch UUIDs from API and add new ones to the POST_IDS list in post_ids.json
 """
 
-import re
 import requests
 
+from post_ids import IDS_FILE, load_ids, save_ids
+
 
 def fetch_uuids_from_api(auth_token):
     """Fetch all UUIDs from the API"""
@@ -51,58 +52,24 @@ def fetch_uuids_from_api(auth_token):
         return [], 0
 
 
-def get_existing_post_ids(post_ids_file="post_ids.py"):
-    """Extract existing POST_IDS from post_ids.py"""
+def get_existing_post_ids(post_ids_file=IDS_FILE):
+    """Read the existing POST_IDS from post_ids.json, in order"""
     try:
-        with open(post_ids_file, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        # Extract POST_IDS array
-        pattern = r"POST_IDS\s*=\s*\[([\s\S]*?)\]"
-        match = re.search(pattern, content)
-
-        if match:
-            ids_content = match.group(1)
-            # Extract all UUIDs
-            uuid_pattern = r'"([a-f0-9\-]+)"'
-            existing_ids = re.findall(uuid_pattern, ids_content)
-            return set(existing_ids)
-
-        return set()
+        return load_ids(post_ids_file).get("POST_IDS", [])
     except FileNotFoundError:
         print(f"❌ File '{post_ids_file}' not found")
-        return set()
+        return []
 
 
-def update_post_ids_file_with_new_ids(new_uuids, post_ids_file="post_ids.py"):
-    """Add new UUIDs to POST_IDS array in post_ids.py"""
+def update_post_ids_file_with_new_ids(new_uuids, post_ids_file=IDS_FILE):
+    """Append new UUIDs to the POST_IDS list in post_ids.json"""
     try:
-        with open(post_ids_file, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        # Get existing IDs
-        existing_ids = get_existing_post_ids(post_ids_file)
-
         # Combine existing + new (maintaining order)
-        all_ids = list(existing_ids) + new_uuids
-
-        # Create the new POST_IDS array string
-        post_ids_str = "POST_IDS = [\n"
-        for uuid in all_ids:
-            post_ids_str += f'    "{uuid}",\n'
-        post_ids_str += "]"
-
-        # Replace the old POST_IDS array with the new one
-        pattern = r"POST_IDS\s*=\s*\[[\s\S]*?\]"
-        new_content = re.sub(pattern, post_ids_str, content)
-
-        # Write back to post_ids.py
-        with open(post_ids_file, "w", encoding="utf-8") as f:
-            f.write(new_content)
-
+        all_ids = get_existing_post_ids(post_ids_file) + new_uuids
+        save_ids("POST_IDS", all_ids, post_ids_file)
         return len(all_ids)
     except Exception as e:
-        print(f"❌ Error updating post_ids.py: {e}")
+        print(f"❌ Error updating post_ids.json: {e}")
         return 0
 
 
@@ -121,27 +88,27 @@ def main():
 
     print(f"✅ Found {len(api_uuids)} unique UUIDs from {total_assets} assets")
 
-    # Get existing IDs from post_ids.py
+    # Get existing IDs from post_ids.json
     print(f"\n🔍 Checking for new IDs...")
-    existing_ids = get_existing_post_ids("post_ids.py")
-    print(f"📋 Existing IDs in post_ids.py: {len(existing_ids)}")
+    existing_ids = set(get_existing_post_ids())
+    print(f"📋 Existing IDs in post_ids.json: {len(existing_ids)}")
 
     # Find new IDs
     new_ids = [uuid for uuid in api_uuids if uuid not in existing_ids]
 
     if not new_ids:
-        print("✅ No new IDs to add. All IDs are already in post_ids.py!")
+        print("✅ No new IDs to add. All IDs are already in post_ids.json!")
         return
 
     print(f"\n🆕 Found {len(new_ids)} NEW IDs:")
     for i, new_id in enumerate(new_ids, 1):
         print(f"  {i}. {new_id}")
 
-    # Update post_ids.py with new IDs
-    print(f"\n📝 Adding new IDs to post_ids.py...")
-    total_count = update_post_ids_file_with_new_ids(new_ids, "post_ids.py")
+    # Update post_ids.json with new IDs
+    print(f"\n📝 Adding new IDs to post_ids.json...")
+    total_count = update_post_ids_file_with_new_ids(new_ids)
 
-    print(f"✅ Successfully updated! Total IDs in post_ids.py: {total_count}")
+    print(f"✅ Successfully updated! Total IDs in post_ids.json: {total_count}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Single-pass hash aggregation of asset metrics by category, plugin, style,
+aspect ratio or created_at time bucket
+
+Usage:
+  python3 group_by.py data.json                          default breakdowns
+  python3 group_by.py data.json plugin month             chosen keys
+  python3 group_by.py data.json category+aspect_ratio    composite key
+"""
+
+import sys
+from datetime import date
+
+from asset_loader import HEAVY_FIELDS, iter_assets_from_file
+
+DEFAULT_KEYS = ("category", "plugin", "style", "aspect_ratio", "month")
+DEFAULT_METRICS = ("favorites", "views", "downloads")
+
+
+def _settings(asset, name):
+    return (asset.get("settings") or {}).get(name)
+
+
+def _iso_week(asset):
+    created = asset.get("created_at") or ""
+    if len(created) < 10:
+        return None
+    year, week, _ = date.fromisoformat(created[:10]).isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+# Group key name -> function extracting the group value from an asset.
+# Day/month buckets slice the ISO timestamp instead of parsing it.
+KEY_FUNCS = {
+    "category": lambda a: a.get("category"),
+    "plugin": lambda a: _settings(a, "plugin_name"),
+    "style": lambda a: a.get("style_id"),
+    "aspect_ratio": lambda a: _settings(a, "aspect_ratio"),
+    "day": lambda a: (a.get("created_at") or "")[:10] or None,
+    "week": _iso_week,
+    "month": lambda a: (a.get("created_at") or "")[:7] or None,
+}
+
+
+def _median(histogram, count):
+    """Median from a {value: occurrences} histogram holding `count` values"""
+    if not count:
+        return 0
+    lower, upper = (count - 1) // 2, count // 2
+    low = high = None
+    seen = 0
+    for value in sorted(histogram):
+        seen += histogram[value]
+        if low is None and seen > lower:
+            low = value
+        if seen > upper:
+            high = value
+            break
+    return (low + high) / 2
+
+
+class GroupBy:
+    """
+    Aggregate any number of group keys in one scan over the assets.
+
+    A key is a name from KEY_FUNCS or a '+'-joined composite like
+    "category+aspect_ratio". Every group keeps a count, a sum and a value
+    histogram per metric; counters repeat heavily, so the histograms stay
+    small while still giving exact medians.
+    """
+
+    def __init__(self, keys=DEFAULT_KEYS, metrics=DEFAULT_METRICS):
+        self.keys = tuple(keys)
+        self.metrics = tuple(metrics)
+        self._extractors = []
+        for key in self.keys:
+            parts = key.split("+")
+            unknown = [p for p in parts if p not in KEY_FUNCS]
+            if unknown:
+                raise ValueError(f"Unknown group key {unknown}, expected {list(KEY_FUNCS)}")
+            funcs = [KEY_FUNCS[p] for p in parts]
+            self._extractors.append(
+                funcs[0] if len(funcs) == 1 else (lambda a, fs=funcs: tuple(f(a) for f in fs))
+            )
+        # key -> group value -> [count, {metric: sum}, {metric: histogram}]
+        self._groups = {key: {} for key in self.keys}
+
+    def add(self, asset):
+        values = [asset.get(m, 0) or 0 for m in self.metrics]
+
+        for key, extract in zip(self.keys, self._extractors):
+            groups = self._groups[key]
+            group_value = extract(asset)
+            state = groups.get(group_value)
+            if state is None:
+                state = groups[group_value] = [
+                    0,
+                    [0] * len(self.metrics),
+                    [{} for _ in self.metrics],
+                ]
+            state[0] += 1
+            sums, histograms = state[1], state[2]
+            for i, value in enumerate(values):
+                sums[i] += value
+                histogram = histograms[i]
+                histogram[value] = histogram.get(value, 0) + 1
+
+    def update(self, assets):
+        add = self.add
+        for asset in assets:
+            add(asset)
+        return self
+
+    def results(self, key, sort_by="count"):
+        """
+        Return one row per group for `key`, largest first by `sort_by`.
+
+        Rows hold group, count and, per metric, <m>_sum / <m>_mean /
+        <m>_median, plus <m>_per_view ratios when views is aggregated.
+        """
+        rows = []
+        views_index = self.metrics.index("views") if "views" in self.metrics else None
+
+        for group_value, (count, sums, histograms) in self._groups[key].items():
+            row = {"group": group_value, "count": count}
+            for metric, total, histogram in zip(self.metrics, sums, histograms):
+                row[f"{metric}_sum"] = total
+                row[f"{metric}_mean"] = total / count
+                row[f"{metric}_median"] = _median(histogram, count)
+
+            if views_index is not None:
+                total_views = sums[views_index]
+                for metric, total in zip(self.metrics, sums):
+                    if metric != "views":
+                        row[f"{metric}_per_view"] = total / total_views if total_views else 0.0
+            rows.append(row)
+
+        rows.sort(key=lambda r: r[sort_by], reverse=True)
+        return rows
+
+
+def group_by(assets, keys=DEFAULT_KEYS, metrics=DEFAULT_METRICS):
+    """Build a GroupBy from an iterable of assets in a single pass"""
+    return GroupBy(keys, metrics).update(assets)
+
+
+def display_breakdowns(grouped, top_n=15):
+    """Print a table per group key"""
+    for key in grouped.keys:
+        rows = grouped.results(key)
+        print("\n" + "=" * 100)
+        print(f"🧩 BREAKDOWN BY {key.upper()} ({len(rows)} groups)")
+        print("=" * 100)
+        print(
+            f"{'Group':<28} {'Posts':<8} {'❤️ Sum':<9} {'❤️ Mean':<9} {'❤️ Med':<8} "
+            f"{'👁️ Sum':<9} {'👁️ Mean':<9} {'❤️/👁️':<8}"
+        )
+        print("-" * 100)
+        for row in rows[:top_n]:
+            group = row["group"]
+            if isinstance(group, tuple):
+                group = " / ".join(str(g) for g in group)
+            print(
+                f"{str(group)[:26]:<28} {row['count']:<8,} "
+                f"{row['favorites_sum']:<9,} {row['favorites_mean']:<9.2f} {row['favorites_median']:<8g} "
+                f"{row['views_sum']:<9,} {row['views_mean']:<9.2f} {row['favorites_per_view']:<8.3f}"
+            )
+        if len(rows) > top_n:
+            print(f"... {len(rows) - top_n} more groups")
+        print("-" * 100)
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        return
+
+    keys = sys.argv[2:] or DEFAULT_KEYS
+    assets = iter_assets_from_file(sys.argv[1], skip_fields=HEAVY_FIELDS)
+    display_breakdowns(group_by(assets, keys))
+
+
+if __name__ == "__main__":
+    main()
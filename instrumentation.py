@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Opt-in stage timers, counters and tracemalloc peaks for the stats pipeline
+
+Disabled by default: stage() hands back a shared no-op context manager and
+count()/add_time() return immediately, so instrumented code costs a global
+lookup per call. Enable with enable() or PROFILE_STATS_TRACE=1.
+
+Work done in pool workers is collected there and handed back with
+worker_settings() / export() / merge(), so one trace covers every process.
+"""
+
+import contextlib
+import json
+import os
+import threading
+import time
+import tracemalloc
+
+enabled = False
+
+_trace_memory = False
+_origin = 0.0
+_events = []
+_counters = {}
+_timers = {}
+_depth = threading.local()
+_NULL_STAGE = contextlib.nullcontext()
+
+
+def enable(trace_memory=False):
+    """Start collecting; trace_memory also records tracemalloc peaks per stage"""
+    global enabled, _trace_memory, _origin
+    reset()
+    enabled = True
+    _trace_memory = trace_memory
+    _origin = time.perf_counter()
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def disable():
+    global enabled
+    enabled = False
+    if _trace_memory and tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def reset():
+    _events.clear()
+    _counters.clear()
+    _timers.clear()
+
+
+def enable_from_env():
+    """Enable if PROFILE_STATS_TRACE is set; returns the requested output path or None"""
+    value = os.environ.get("PROFILE_STATS_TRACE")
+    if not value:
+        return None
+    enable(trace_memory=os.environ.get("PROFILE_STATS_TRACE_MEMORY") == "1")
+    return None if value == "1" else value
+
+
+def worker_settings():
+    """enable() arguments for a worker process, or None while disabled"""
+    return {"trace_memory": _trace_memory} if enabled else None
+
+
+def export():
+    """This process's events, timers and counters, for merge() in the parent"""
+    return {
+        "pid": os.getpid(),
+        "origin": _origin,
+        "events": list(_events),
+        "timers": dict(_timers),
+        "counters": dict(_counters),
+    }
+
+
+def merge(data):
+    """Fold a worker's export() into this process, on this process's timeline"""
+    if not enabled:
+        return
+    # perf_counter is system-wide, so the origins of both processes compare
+    shift = data["origin"] - _origin
+    for event in data["events"]:
+        _events.append({**event, "start": event["start"] + shift, "pid": data["pid"]})
+    for name, seconds in data["timers"].items():
+        add_time(name, seconds)
+    for name, value in data["counters"].items():
+        count(name, value)
+
+
+class _Stage:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        depth = getattr(_depth, "value", 0)
+        if _trace_memory and depth == 0:
+            tracemalloc.reset_peak()
+        _depth.value = depth + 1
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter()
+        _depth.value -= 1
+        event = {
+            "name": self.name,
+            "start": self.start - _origin,
+            "duration": end - self.start,
+            "thread": threading.get_ident(),
+        }
+        if _trace_memory:
+            event["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        _events.append(event)
+        return False
+
+
+def stage(name):
+    """Context manager timing one pipeline stage (no-op when disabled)"""
+    if not enabled:
+        return _NULL_STAGE
+    return _Stage(name)
+
+
+def count(name, value=1):
+    """Add to a counter such as bytes_fetched or assets_processed"""
+    if enabled:
+        _counters[name] = _counters.get(name, 0) + value
+
+
+def add_time(name, seconds):
+    """Accumulate time spent in work interleaved with other stages (e.g. decode)"""
+    if enabled:
+        _timers[name] = _timers.get(name, 0.0) + seconds
+
+
+def summary():
+    """Per-stage totals, accumulated timers and counters as a plain dict"""
+    stages = {}
+    for event in _events:
+        entry = stages.setdefault(event["name"], {"calls": 0, "seconds": 0.0})
+        entry["calls"] += 1
+        entry["seconds"] += event["duration"]
+        if "peak_bytes" in event:
+            entry["peak_bytes"] = max(entry.get("peak_bytes", 0), event["peak_bytes"])
+
+    result = {
+        "stages": stages,
+        "timers": dict(_timers),
+        "counters": dict(_counters),
+    }
+    peaks = [entry["peak_bytes"] for entry in stages.values() if "peak_bytes" in entry]
+    if peaks:
+        result["peak_bytes"] = max(peaks)
+    return result
+
+
+def write_summary(path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(summary(), f, indent=2)
+
+
+def write_chrome_trace(path):
+    """Write stages as a Chrome trace (open in chrome://tracing or Perfetto)"""
+    pid = os.getpid()
+    trace_events = [
+        {
+            "name": event["name"],
+            "ph": "X",
+            "ts": event["start"] * 1e6,
+            "dur": event["duration"] * 1e6,
+            "pid": event.get("pid", pid),
+            "tid": event["thread"],
+            "args": {"peak_bytes": event["peak_bytes"]} if "peak_bytes" in event else {},
+        }
+        for event in _events
+    ]
+    end = time.perf_counter() - _origin
+    trace_events.append(
+        {"name": "counters", "ph": "C", "ts": end * 1e6, "pid": pid, "args": dict(_counters)}
+    )
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, f)
+
+
+def write_report(path):
+    """Write a Chrome trace for *.trace.json paths, a JSON summary otherwise"""
+    if path.endswith(".trace.json"):
+        write_chrome_trace(path)
+    else:
+        write_summary(path)
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Append-only SQLite history of per-asset favorites/views/downloads across snapshots
+"""
+
+import sqlite3
+import sys
+import time
+
+HISTORY_DB = "metrics_history.db"
+
+TRACKED_METRICS = ("favorites", "views", "downloads")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    captured_at REAL PRIMARY KEY,
+    username TEXT,
+    asset_count INTEGER,
+    changed_count INTEGER
+);
+-- One row per asset per snapshot in which one of its metrics changed
+CREATE TABLE IF NOT EXISTS asset_metrics (
+    uuid TEXT NOT NULL,
+    captured_at REAL NOT NULL,
+    favorites INTEGER NOT NULL,
+    views INTEGER NOT NULL,
+    downloads INTEGER NOT NULL,
+    PRIMARY KEY (uuid, captured_at)
+) WITHOUT ROWID;
+-- Most recent values per asset, so a snapshot is diffed without scanning history
+CREATE TABLE IF NOT EXISTS latest (
+    uuid TEXT PRIMARY KEY,
+    username TEXT,
+    title TEXT,
+    captured_at REAL NOT NULL,
+    favorites INTEGER NOT NULL,
+    views INTEGER NOT NULL,
+    downloads INTEGER NOT NULL
+);
+"""
+
+
+class MetricsHistory:
+    """Records metric changes per snapshot and answers growth queries"""
+
+    def __init__(self, path=HISTORY_DB):
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(_SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def track(self, assets, username=None, captured_at=None):
+        """
+        Pass assets through unchanged while recording the ones whose metrics moved.
+
+        Works on a streaming iterator: each asset is compared to the `latest`
+        row by primary key, and only new or changed assets are written. The
+        snapshot is committed once the iterator is exhausted; if it fails or
+        is abandoned partway (e.g. a page fetch error), or yields no assets
+        at all, nothing is recorded.
+        """
+        captured_at = captured_at or time.time()
+        conn = self.conn
+        asset_count = 0
+        changed_count = 0
+
+        try:
+            for asset in assets:
+                asset_count += 1
+                uuid = asset.get("uuid")
+                if uuid:
+                    values = tuple(asset.get(m, 0) or 0 for m in TRACKED_METRICS)
+                    previous = conn.execute(
+                        "SELECT favorites, views, downloads FROM latest WHERE uuid = ?",
+                        (uuid,),
+                    ).fetchone()
+
+                    if previous != values:
+                        changed_count += 1
+                        conn.execute(
+                            "INSERT OR REPLACE INTO asset_metrics VALUES (?, ?, ?, ?, ?)",
+                            (uuid, captured_at) + values,
+                        )
+                        conn.execute(
+                            "INSERT OR REPLACE INTO latest VALUES (?, ?, ?, ?, ?, ?, ?)",
+                            (uuid, username, asset.get("title"), captured_at) + values,
+                        )
+                yield asset
+        except BaseException:
+            conn.rollback()
+            raise
+
+        if not asset_count:
+            # An empty fetch (unknown or private profile) is not a snapshot
+            return
+        conn.execute(
+            "INSERT OR REPLACE INTO snapshots VALUES (?, ?, ?, ?)",
+            (captured_at, username, asset_count, changed_count),
+        )
+        conn.commit()
+
+    def record(self, assets, username=None, captured_at=None):
+        """Record a whole snapshot, returning the number of changed assets"""
+        captured_at = captured_at or time.time()
+        for _ in self.track(assets, username, captured_at):
+            pass
+        return self.conn.execute(
+            "SELECT changed_count FROM snapshots WHERE captured_at = ?", (captured_at,)
+        ).fetchone()[0]
+
+    def history(self, uuid):
+        """Return [(captured_at, favorites, views, downloads), ...] for one asset"""
+        return self.conn.execute(
+            "SELECT captured_at, favorites, views, downloads FROM asset_metrics "
+            "WHERE uuid = ? ORDER BY captured_at",
+            (uuid,),
+        ).fetchall()
+
+    def last_captured_at(self, username=None):
+        """Timestamp of the most recent snapshot (optionally for one username)"""
+        if username is None:
+            row = self.conn.execute("SELECT MAX(captured_at) FROM snapshots").fetchone()
+        else:
+            row = self.conn.execute(
+                "SELECT MAX(captured_at) FROM snapshots WHERE username = ?", (username,)
+            ).fetchone()
+        return row[0]
+
+    def fastest_growing(self, metric="views", days=7, top_n=10, username=None):
+        """
+        Return the assets whose metric grew most over the last `days`.
+
+        Each result is a dict with uuid, title, gain and rate_per_day. The
+        baseline is the asset's last value at or before the window start; if
+        it has none, its earliest row inside the window. Only assets first
+        seen after their profile's first snapshot start from 0, measured from
+        the snapshot before they appeared. rate_per_day divides by the span
+        actually covered (latest snapshot minus baseline time). Every lookup
+        is a probe on the (uuid, captured_at) primary key.
+        """
+        if metric not in TRACKED_METRICS:
+            raise ValueError(f"Unknown metric '{metric}', expected one of {TRACKED_METRICS}")
+
+        end = self.last_captured_at(username)
+        if end is None:
+            return []
+        start = end - days * 86400
+
+        query = f"""
+            WITH base AS (
+                SELECT l.uuid, l.title, l.username, l.{metric} AS current,
+                    (SELECT h.{metric} FROM asset_metrics h
+                     WHERE h.uuid = l.uuid AND h.captured_at <= :start
+                     ORDER BY h.captured_at DESC LIMIT 1) AS before_value,
+                    (SELECT h.captured_at FROM asset_metrics h
+                     WHERE h.uuid = l.uuid ORDER BY h.captured_at LIMIT 1) AS first_seen,
+                    (SELECT h.{metric} FROM asset_metrics h
+                     WHERE h.uuid = l.uuid ORDER BY h.captured_at LIMIT 1) AS first_value,
+                    (SELECT MIN(s.captured_at) FROM snapshots s
+                     WHERE s.username IS l.username) AS tracking_start
+                FROM latest l
+                WHERE (:username IS NULL OR l.username = :username)
+            )
+            SELECT uuid, title,
+                CASE
+                    WHEN before_value IS NOT NULL THEN current - before_value
+                    WHEN first_seen > tracking_start THEN current
+                    ELSE current - first_value
+                END AS gain,
+                CASE
+                    WHEN before_value IS NOT NULL THEN :start
+                    WHEN first_seen > tracking_start THEN MAX(:start, (
+                        SELECT MAX(s.captured_at) FROM snapshots s
+                        WHERE s.username IS base.username AND s.captured_at < first_seen
+                    ))
+                    ELSE first_seen
+                END AS baseline_at
+            FROM base
+            ORDER BY gain DESC
+            LIMIT :top_n
+        """
+        rows = self.conn.execute(
+            query, {"start": start, "username": username, "top_n": top_n}
+        ).fetchall()
+
+        results = []
+        for uuid, title, gain, baseline_at in rows:
+            elapsed_days = (end - baseline_at) / 86400
+            rate = gain / elapsed_days if elapsed_days > 0 else 0.0
+            results.append({"uuid": uuid, "title": title, "gain": gain, "rate_per_day": rate})
+        return results
+
+
+def main():
+    # Usage: python3 metrics_history.py [metric] [days]
+    metric = sys.argv[1] if len(sys.argv) > 1 else "views"
+    days = float(sys.argv[2]) if len(sys.argv) > 2 else 7
+
+    history = MetricsHistory()
+    results = history.fastest_growing(metric, days)
+    history.close()
+
+    if not results:
+        print(f"❌ No snapshots recorded yet in {HISTORY_DB}")
+        print("💡 Run 'python3 profile_stats.py' to record one")
+        return
+
+    print(f"\n🚀 FASTEST GROWING POSTS BY {metric.upper()} (last {days:g} days)")
+    print("-" * 80)
+    print(f"{'#':<4} {'Title':<44} {'Gain':<12} {'Per Day':<12}")
+    print("-" * 80)
+    for i, row in enumerate(results, 1):
+        title = (row["title"] or "Untitled")[:42]
+        print(f"{i:<4} {title:<44} {row['gain']:<12,} {row['rate_per_day']:<12.1f}")
+    print("-" * 80)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Full-text index (SQLite FTS5) over titles, tags, prompts and plugins of published assets
+
+Usage:
+  python3 prompt_index.py update data.json
+  python3 prompt_index.py search "orange backdrop portrait"
+"""
+
+import hashlib
+import sqlite3
+import sys
+
+from asset_loader import iter_assets_from_file
+
+INDEX_DB = "prompt_index.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS assets (
+    id INTEGER PRIMARY KEY,
+    uuid TEXT UNIQUE NOT NULL,
+    title TEXT,
+    favorites INTEGER,
+    views INTEGER,
+    downloads INTEGER,
+    text_hash TEXT
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS asset_text USING fts5(
+    title, tags, prompt, plugin_name, tokenize = 'porter unicode61'
+);
+"""
+
+# bm25 column weights: a hit in the title or tags matters more than in the prompt
+_BM25 = "bm25(asset_text, 5.0, 3.0, 1.0, 1.0)"
+
+
+def _indexed_text(asset):
+    """Return (title, tags, prompt, plugin_name) for one asset dict"""
+    settings = asset.get("settings") or {}
+    return (
+        asset.get("title") or "",
+        " ".join(asset.get("tags") or []),
+        settings.get("prompt") or "",
+        settings.get("plugin_name") or "",
+    )
+
+
+def _fts_query(text):
+    """Turn free text into an FTS5 query where every word must match"""
+    words = [w.replace('"', '""') for w in text.split()]
+    return " ".join(f'"{w}"' for w in words)
+
+
+class PromptIndex:
+    """Incrementally updated FTS5 index joined with each asset's stats"""
+
+    def __init__(self, path=INDEX_DB):
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(_SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def update(self, assets, prune=False):
+        """
+        Add or refresh assets from a snapshot.
+
+        Stats are always refreshed, but an asset's text is only re-indexed if
+        its hash changed, so a new snapshot costs one hash per asset plus work
+        proportional to what actually changed. With prune=True assets missing
+        from the snapshot are removed. Returns (added, reindexed, removed).
+        """
+        conn = self.conn
+        added = reindexed = removed = 0
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS seen (uuid TEXT PRIMARY KEY)")
+        conn.execute("DELETE FROM seen")
+
+        for asset in assets:
+            uuid = asset.get("uuid")
+            if not uuid:
+                continue
+            text = _indexed_text(asset)
+            joined = "\x1f".join(text).encode("utf-8")
+            text_hash = hashlib.blake2b(joined, digest_size=16).hexdigest()
+            stats = (
+                asset.get("title"),
+                asset.get("favorites", 0),
+                asset.get("views", 0),
+                asset.get("downloads", 0),
+            )
+            conn.execute("INSERT OR IGNORE INTO seen VALUES (?)", (uuid,))
+
+            row = conn.execute(
+                "SELECT id, text_hash FROM assets WHERE uuid = ?", (uuid,)
+            ).fetchone()
+            if row is None:
+                cursor = conn.execute(
+                    "INSERT INTO assets (uuid, title, favorites, views, downloads, text_hash) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (uuid,) + stats + (text_hash,),
+                )
+                conn.execute(
+                    "INSERT INTO asset_text (rowid, title, tags, prompt, plugin_name) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (cursor.lastrowid,) + text,
+                )
+                added += 1
+                continue
+
+            row_id, old_hash = row
+            conn.execute(
+                "UPDATE assets SET title = ?, favorites = ?, views = ?, downloads = ?, "
+                "text_hash = ? WHERE id = ?",
+                stats + (text_hash, row_id),
+            )
+            if old_hash != text_hash:
+                conn.execute("DELETE FROM asset_text WHERE rowid = ?", (row_id,))
+                conn.execute(
+                    "INSERT INTO asset_text (rowid, title, tags, prompt, plugin_name) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (row_id,) + text,
+                )
+                reindexed += 1
+
+        if prune:
+            stale = "SELECT id FROM assets WHERE uuid NOT IN (SELECT uuid FROM seen)"
+            conn.execute(f"DELETE FROM asset_text WHERE rowid IN ({stale})")
+            removed = conn.execute(
+                "DELETE FROM assets WHERE uuid NOT IN (SELECT uuid FROM seen)"
+            ).rowcount
+
+        conn.commit()
+        return added, reindexed, removed
+
+    def search(self, query, top_n=10, order_by="rank"):
+        """
+        Return matching assets with their stats, best first.
+
+        order_by is "rank" (bm25 relevance) or a stat column such as
+        "favorites" / "views" / "downloads" (ties broken by relevance).
+        """
+        if order_by == "rank":
+            order = "score"
+        elif order_by in ("favorites", "views", "downloads"):
+            order = f"a.{order_by} DESC, score"
+        else:
+            raise ValueError(f"Unknown order_by '{order_by}'")
+
+        match = _fts_query(query)
+        if not match:
+            return []
+
+        rows = self.conn.execute(
+            f"SELECT a.uuid, a.title, a.favorites, a.views, a.downloads, {_BM25} AS score "
+            f"FROM asset_text JOIN assets a ON a.id = asset_text.rowid "
+            f"WHERE asset_text MATCH ? ORDER BY {order} LIMIT ?",
+            (match, top_n),
+        ).fetchall()
+        return [
+            {
+                "uuid": uuid,
+                "title": title,
+                "favorites": favorites,
+                "views": views,
+                "downloads": downloads,
+                "score": -score,
+            }
+            for uuid, title, favorites, views, downloads, score in rows
+        ]
+
+
+def main():
+    if len(sys.argv) < 3 or sys.argv[1] not in ("update", "search"):
+        print(__doc__)
+        return
+
+    index = PromptIndex()
+    if sys.argv[1] == "update":
+        # A snapshot is the whole catalog, so anything missing was unpublished
+        assets = iter_assets_from_file(sys.argv[2])
+        added, reindexed, removed = index.update(assets, prune=True)
+        print(f"✅ Index updated: {added} added, {reindexed} re-indexed, {removed} removed")
+        index.close()
+        return
+
+    query = " ".join(sys.argv[2:])
+    results = index.search(query)
+    index.close()
+
+    if not results:
+        print(f"❌ No posts match '{query}'")
+        return
+
+    print(f"\n🔎 POSTS MATCHING '{query}'")
+    print("-" * 100)
+    print(f"{'#':<4} {'Title':<40} {'❤️ Likes':<12} {'👁️ Views':<12} {'UUID':<38}")
+    print("-" * 100)
+    for i, row in enumerate(results, 1):
+        title = (row["title"] or "Untitled")[:38]
+        print(f"{i:<4} {title:<40} {row['favorites']:<12,} {row['views']:<12,} {row['uuid']:<38}")
+    print("-" * 100)
+
+
+if __name__ == "__main__":
+    main()
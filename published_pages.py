@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Paginated, streaming fetch of /user/{username}/published
+"""
+
+import os
+import sys
+import time
+
+import requests
+
+import instrumentation
+from asset_loader import strip_fields
+
+# Point the analytics path at another server, e.g. stand_in_api.py for offline load tests
+API_BASE = os.environ.get("IMAGINE_API_BASE", "https://imagine.vyro.ai/v1").rstrip("/")
+
+PAGE_SIZE = 100
+
+MAX_RETRIES = 3
+
+
+def published_url(username, limit=3000, offset=None):
+    """Return the /published endpoint URL for a user (optionally one page of it)"""
+    url = f"{API_BASE}/user/{username}/published?limit={limit}"
+    if offset is not None:
+        url += f"&offset={offset}"
+    return url
+
+
+def build_headers(auth_token):
+    """Browser-like request headers used for the API"""
+    return {
+        "accept": "application/json, text/plain, */*",
+        "accept-language": "en-GB,en-US;q=0.9,en;q=0.8,hi;q=0.7,gu;q=0.6",
+        "authorization": f"Bearer {auth_token}",
+        "dnt": "1",
+        "origin": "https://www.imagine.art",
+        "priority": "u=1, i",
+        "referer": "https://www.imagine.art/",
+        "sec-ch-ua": '"Chromium";v="142", "Google Chrome";v="142", "Not_A Brand";v="99"',
+        "sec-ch-ua-mobile": "?0",
+        "sec-ch-ua-platform": '"macOS"',
+        "sec-fetch-dest": "empty",
+        "sec-fetch-mode": "cors",
+        "sec-fetch-site": "cross-site",
+        "user-agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.0.0 Safari/537.36",
+    }
+
+
+class RepeatedPageError(requests.exceptions.RequestException):
+    """The endpoint ignored offset and served a page it had already sent"""
+
+
+class PageFetcher:
+    """
+    Iterate over a user's published assets one page at a time.
+
+    Iterating yields assets as soon as their page arrives and stops at the
+    first empty page, so a server-side cap on limit is harmless; a page that
+    repeats the previous one raises RepeatedPageError. `cursor` is
+    the offset of the next page to request, so after a failure a new fetcher
+    created with start=old_fetcher.cursor resumes where the old one stopped.
+    """
+
+    def __init__(
+        self,
+        username,
+        auth_token,
+        page_size=PAGE_SIZE,
+        start=0,
+        skip_fields=(),
+        verbose=True,
+        base_url=None,
+    ):
+        self.username = username
+        self.headers = build_headers(auth_token)
+        self.page_size = page_size
+        self.cursor = start
+        self.skip_fields = skip_fields
+        self.verbose = verbose
+        self.base_url = base_url
+        self.pages = 0
+        self.asset_count = 0
+        self.bytes_fetched = 0
+        self.elapsed = 0.0
+
+    def _url(self, offset):
+        if self.base_url:
+            return f"{self.base_url}?limit={self.page_size}&offset={offset}"
+        return published_url(self.username, self.page_size, offset)
+
+    def _get(self, url):
+        """GET one page, retrying transient failures with exponential backoff"""
+        for attempt in range(MAX_RETRIES):
+            try:
+                response = requests.get(url, headers=self.headers)
+                response.raise_for_status()
+                return response
+            except requests.exceptions.RequestException:
+                if attempt == MAX_RETRIES - 1:
+                    raise
+                time.sleep(2**attempt)
+
+    @property
+    def catalog_url(self):
+        """URL identifying the whole catalog, whatever the page size (a cache key)"""
+        return self.base_url or published_url(self.username)
+
+    @property
+    def bytes_per_second(self):
+        return self.bytes_fetched / self.elapsed if self.elapsed else 0.0
+
+    def iter_pages(self):
+        """Yield each page as a list of assets, advancing the cursor"""
+        previous_first = None
+
+        while True:
+            started = time.perf_counter()
+            with instrumentation.stage("fetch_page"):
+                response = self._get(self._url(self.cursor))
+                assets = response.json().get("assets", [])
+            self.elapsed += time.perf_counter() - started
+            self.bytes_fetched += len(response.content)
+            instrumentation.count("bytes_fetched", len(response.content))
+
+            # Only an empty page ends the catalog: a short one may just mean the
+            # server caps limit below page_size
+            if not assets:
+                return
+
+            # Guard against an endpoint that ignores offset and repeats page one:
+            # the catalog is incomplete, so callers must not treat it as finished
+            first = assets[0].get("uuid")
+            if first is not None and first == previous_first:
+                raise RepeatedPageError(
+                    f"API returned the same page twice at offset {self.cursor}"
+                )
+            previous_first = first
+
+            if self.skip_fields:
+                for asset in assets:
+                    strip_fields(asset, self.skip_fields)
+
+            self.pages += 1
+            self.asset_count += len(assets)
+            self.cursor += len(assets)
+            if self.verbose:
+                print(
+                    f"   📥 Page {self.pages}: {len(assets)} assets "
+                    f"({self.asset_count} total, {self.bytes_per_second / 1024:,.0f} KB/s)",
+                    file=sys.stderr,
+                )
+            yield assets
+
+    def __iter__(self):
+        for page in self.iter_pages():
+            yield from page
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Buffered rendering of profile reports as a console table, CSV, JSON Lines or Markdown
+"""
+
+import csv
+import io
+import json
+import sys
+
+FORMATS = ("table", "csv", "jsonl", "markdown")
+
+# Rows are written out in batches of this size, so huge top-N lists stream
+FLUSH_ROWS = 5000
+
+COLUMN_LABELS = {
+    "favorites": "❤️ Likes",
+    "views": "👁️ Views",
+    "downloads": "⬇️ Downloads",
+    "bookmarks": "🔖 Bookmarks",
+    "favorites_per_view": "💯 Likes/View",
+    "downloads_per_view": "⬇️ DL/View",
+    "bookmarks_per_favorite": "🔖 Saves/Like",
+    "favorites_per_day": "🚀 Likes/Day",
+    "views_per_day": "🚀 Views/Day",
+    "favorites_delta": "❤️ +Likes",
+    "views_delta": "👁️ +Views",
+    "downloads_delta": "⬇️ +Downloads",
+    "bookmarks_delta": "🔖 +Bookmarks",
+}
+
+ROW_FIELDS = ("uuid", "title", "favorites", "views", "downloads", "bookmarks")
+
+
+class _Writer:
+    """Collects output in a list and writes it to `out` in as few calls as possible"""
+
+    def __init__(self, out, flush_rows):
+        self.out = out
+        self.flush_rows = flush_rows
+        self.parts = []
+
+    def line(self, text=""):
+        self.parts.append(text)
+        self.parts.append("\n")
+        if len(self.parts) >= self.flush_rows * 2:
+            self.flush()
+
+    def flush(self):
+        if self.parts:
+            self.out.write("".join(self.parts))
+            self.parts = []
+
+
+def _label(column):
+    return COLUMN_LABELS.get(column, column.title())
+
+
+def _number(value):
+    """Counters with thousands separators, derived ratios with fixed decimals"""
+    return f"{value:,.4f}" if isinstance(value, float) else f"{value:,}"
+
+
+def _is_empty(report):
+    return not report["summary"].get("posts") and not any(
+        section["rows"] for section in report["sections"]
+    )
+
+
+def _summary_label(report, key):
+    return report.get("summary_labels", {}).get(key, f"Total {key.title()}")
+
+
+def _render_table(report, w, first=True):
+    w.line()
+    w.line("=" * 100)
+    w.line(report.get("title") or f"📊 PROFILE STATS FOR @{report['username']}")
+    w.line("=" * 100)
+
+    summary = report["summary"]
+    if _is_empty(report):
+        w.line("❌ No posts found for this user")
+        return
+
+    w.line()
+    w.line(report.get("summary_title", "📈 PROFILE SUMMARY"))
+    for key, value in summary.items():
+        # The original console report printed the post count without separators
+        formatted = value if key == "posts" else f"{value:,}"
+        w.line(f"   {_summary_label(report, key)}: {formatted}")
+
+    for section in report["sections"]:
+        primary, secondary = section["columns"]
+        w.line()
+        w.line("=" * 100)
+        w.line(section["heading"])
+        w.line("=" * 100)
+        w.line("-" * 100)
+        w.line(f"{'#':<4} {'Title':<50} {_label(primary):<15} {_label(secondary):<15}")
+        w.line("-" * 100)
+        for i, asset in enumerate(section["rows"], 1):
+            title = asset.get("title", "Untitled")[:48]
+            w.line(
+                f"{i:<4} {title:<50} {_number(asset.get(primary, 0)):<15} "
+                f"{_number(asset.get(secondary, 0)):<15}"
+            )
+        w.line("-" * 100)
+
+    w.line()
+    w.line("=" * 100)
+    w.line()
+
+
+def _row_values(asset):
+    return [asset.get(field, "" if field in ("uuid", "title") else 0) for field in ROW_FIELDS]
+
+
+def _render_csv(report, w, first=True):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if first:
+        writer.writerow(("username", "section", "rank") + ROW_FIELDS + ("value",))
+
+    for section in report["sections"]:
+        metric = section["columns"][0]
+        for i, asset in enumerate(section["rows"], 1):
+            writer.writerow(
+                [report["username"], section["name"], i]
+                + _row_values(asset)
+                + [asset.get(metric, 0)]
+            )
+            if i % w.flush_rows == 0:
+                w.parts.append(buffer.getvalue())
+                w.flush()
+                buffer.seek(0)
+                buffer.truncate()
+    w.parts.append(buffer.getvalue())
+
+
+def _render_jsonl(report, w, first=True):
+    dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    w.line(dumps({"type": "summary", "username": report["username"], **report["summary"]}))
+    for section in report["sections"]:
+        metric = section["columns"][0]
+        for i, asset in enumerate(section["rows"], 1):
+            row = dict(zip(ROW_FIELDS, _row_values(asset)))
+            row["value"] = asset.get(metric, 0)
+            w.line(dumps({"type": "row", "section": section["name"], "rank": i, **row}))
+
+
+def _md_cell(value):
+    return str(value).replace("|", "\\|")
+
+
+def _render_markdown(report, w, first=True):
+    if not first:
+        w.line()
+    title = report.get("title") or f"📊 Profile stats for @{report['username']}"
+    w.line(f"## {title}")
+    w.line()
+    summary = report["summary"]
+    if _is_empty(report):
+        w.line("❌ No posts found for this user")
+        return
+
+    labels = report.get("summary_labels", {})
+    w.line("| Metric | Total |")
+    w.line("| --- | ---: |")
+    for key, value in summary.items():
+        w.line(f"| {labels.get(key, key.title())} | {value:,} |")
+
+    for section in report["sections"]:
+        primary, secondary = section["columns"]
+        w.line()
+        w.line(f"### {section['heading'].strip()}")
+        w.line()
+        w.line(f"| # | Title | {_label(primary)} | {_label(secondary)} | UUID |")
+        w.line("| ---: | --- | ---: | ---: | --- |")
+        for i, asset in enumerate(section["rows"], 1):
+            w.line(
+                f"| {i} | {_md_cell(asset.get('title', 'Untitled'))} | "
+                f"{_number(asset.get(primary, 0))} | {_number(asset.get(secondary, 0))} | "
+                f"{asset.get('uuid', '')} |"
+            )
+
+
+_RENDERERS = {
+    "table": _render_table,
+    "csv": _render_csv,
+    "jsonl": _render_jsonl,
+    "markdown": _render_markdown,
+}
+
+
+def render_report(report, fmt="table", out=None, flush_rows=FLUSH_ROWS):
+    """
+    Render a report dict to `out` (stdout by default).
+
+    A report is {"username", "summary": {name: total}, "sections": [{"name",
+    "heading", "columns": (primary, secondary), "rows": [asset, ...]}]}.
+    Optional "title", "summary_title" and "summary_labels" ({name: label})
+    replace the profile wording for other kinds of report.
+    The output is built in memory and written with one call, or in batches
+    of flush_rows rows for very large sections.
+    """
+    render_reports([report], fmt, out, flush_rows)
+
+
+def render_reports(reports, fmt="table", out=None, flush_rows=FLUSH_ROWS):
+    """Render several reports as one document (a single CSV header, etc.)"""
+    if fmt not in _RENDERERS:
+        raise ValueError(f"Unknown format '{fmt}', expected one of {FORMATS}")
+
+    render = _RENDERERS[fmt]
+    writer = _Writer(out or sys.stdout, flush_rows)
+    for i, report in enumerate(reports):
+        render(report, writer, first=i == 0)
+    writer.flush()
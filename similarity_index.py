@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Nearest-neighbour "looks like" index over blurhash and dominant_colors
+
+Usage:
+  python3 similarity_index.py build data.json
+  python3 similarity_index.py query data.json <uuid>
+"""
+
+import os
+import sys
+
+import numpy as np
+
+from asset_loader import iter_assets_from_file
+
+INDEX_FILE = "similarity_index.npz"
+
+# Only text blobs are dropped; dominant_colors is needed here
+SKIP_FIELDS = ("settings.metadata", "description")
+
+_BASE83 = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~"
+_BASE83_VALUES = {c: i for i, c in enumerate(_BASE83)}
+
+# Blurhash components kept per asset (x by y grid, DC included) and colors used
+GRID_X, GRID_Y = 4, 3
+NUM_COLORS = 6
+VECTOR_SIZE = GRID_X * GRID_Y * 3 + NUM_COLORS * 3
+
+
+def _decode83(text):
+    value = 0
+    for c in text:
+        value = value * 83 + _BASE83_VALUES[c]
+    return value
+
+
+def _srgb_to_linear(value):
+    v = value / 255
+    return v / 12.92 if v <= 0.04045 else ((v + 0.055) / 1.055) ** 2.4
+
+
+def decode_blurhash(blurhash):
+    """
+    Decode a blurhash into a GRID_X*GRID_Y*3 vector of DCT colour components.
+
+    Only the compact component list is decoded - no pixels are rendered.
+    Components outside the grid are dropped, missing ones stay 0.
+    """
+    vector = np.zeros(GRID_X * GRID_Y * 3, dtype=np.float32)
+    if not blurhash or len(blurhash) < 6:
+        return vector
+
+    try:
+        size_flag = _decode83(blurhash[0])
+        num_y, num_x = size_flag // 9 + 1, size_flag % 9 + 1
+        if len(blurhash) != 4 + 2 * num_x * num_y:
+            return vector
+        max_value = (_decode83(blurhash[1]) + 1) / 166
+
+        dc = _decode83(blurhash[2:6])
+        vector[0:3] = [
+            _srgb_to_linear(dc >> 16),
+            _srgb_to_linear((dc >> 8) & 255),
+            _srgb_to_linear(dc & 255),
+        ]
+
+        for index in range(1, num_x * num_y):
+            i, j = index % num_x, index // num_x
+            if i >= GRID_X or j >= GRID_Y:
+                continue
+            value = _decode83(blurhash[4 + index * 2 : 6 + index * 2])
+            quantized = (value // (19 * 19), (value // 19) % 19, value % 19)
+            slot = (j * GRID_X + i) * 3
+            for c, q in enumerate(quantized):
+                base = (q - 9) / 9
+                vector[slot + c] = np.copysign(base * base, base) * max_value
+    except KeyError:
+        # Not a valid base83 string
+        vector[:] = 0
+    return vector
+
+
+def decode_colors(colors):
+    """
+    Turn up to NUM_COLORS '#RRGGBB' strings into a fixed-size RGB vector.
+
+    Colours are sorted by luminance so two palettes listing the same colours
+    in a different order still compare as equal.
+    """
+    rgb = []
+    for color in (colors or [])[:NUM_COLORS]:
+        try:
+            value = int(color.lstrip("#")[:6], 16)
+        except ValueError:
+            continue
+        rgb.append(((value >> 16) / 255, ((value >> 8) & 255) / 255, (value & 255) / 255))
+    rgb.sort(key=lambda c: 0.2126 * c[0] + 0.7152 * c[1] + 0.0722 * c[2])
+
+    vector = np.zeros(NUM_COLORS * 3, dtype=np.float32)
+    if rgb:
+        # Pad short palettes with their brightest colour
+        rgb += [rgb[-1]] * (NUM_COLORS - len(rgb))
+        vector[:] = np.asarray(rgb, dtype=np.float32).ravel()
+    return vector
+
+
+def asset_vector(asset):
+    """Feature vector for one asset: blurhash components + palette"""
+    return np.concatenate(
+        [decode_blurhash(asset.get("blurhash")), decode_colors(asset.get("dominant_colors"))]
+    )
+
+
+def _fingerprint(path):
+    stat = os.stat(path)
+    return f"{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+class SimilarityIndex:
+    """Feature matrix plus the stats needed to answer 'how did they perform'"""
+
+    def __init__(self, vectors, uuids, titles, favorites, views, source=""):
+        self.vectors = vectors
+        self.uuids = uuids
+        self.titles = titles
+        self.favorites = favorites
+        self.views = views
+        self.source = source
+        self._positions = {uuid: i for i, uuid in enumerate(uuids)}
+        self._norms = None
+
+    @classmethod
+    def build(cls, assets, source=""):
+        vectors, uuids, titles, favorites, views = [], [], [], [], []
+        for asset in assets:
+            vectors.append(asset_vector(asset))
+            uuids.append(asset.get("uuid") or "")
+            titles.append(asset.get("title") or "Untitled")
+            favorites.append(asset.get("favorites") or 0)
+            views.append(asset.get("views") or 0)
+
+        matrix = np.vstack(vectors) if vectors else np.zeros((0, VECTOR_SIZE), np.float32)
+        return cls(
+            matrix,
+            np.asarray(uuids),
+            np.asarray(titles),
+            np.asarray(favorites, dtype=np.int64),
+            np.asarray(views, dtype=np.int64),
+            source,
+        )
+
+    def save(self, path=INDEX_FILE):
+        np.savez_compressed(
+            path,
+            vectors=self.vectors,
+            uuids=self.uuids,
+            titles=self.titles,
+            favorites=self.favorites,
+            views=self.views,
+            source=np.asarray(self.source),
+        )
+
+    @classmethod
+    def load(cls, path=INDEX_FILE):
+        with np.load(path) as data:
+            return cls(
+                data["vectors"],
+                data["uuids"],
+                data["titles"],
+                data["favorites"],
+                data["views"],
+                str(data["source"]),
+            )
+
+    def query(self, uuid, top_n=10):
+        """
+        Return the top_n assets closest to `uuid`, nearest first.
+
+        One vectorized distance computation against the stored matrix; the
+        pairwise matrix is never materialized.
+        """
+        position = self._positions.get(uuid)
+        if position is None:
+            raise KeyError(f"Asset {uuid} is not in the similarity index")
+        return self.query_vector(self.vectors[position], top_n, exclude=position)
+
+    def query_vector(self, vector, top_n=10, exclude=None):
+        if self._norms is None:
+            self._norms = np.einsum("ij,ij->i", self.vectors, self.vectors)
+        # |a - b|^2 = |a|^2 - 2ab + |b|^2
+        distances = self._norms - 2 * self.vectors @ vector + vector @ vector
+        if exclude is not None:
+            distances[exclude] = np.inf
+
+        count = min(top_n, len(distances) - (exclude is not None))
+        if count <= 0:
+            return []
+        nearest = np.argpartition(distances, count - 1)[:count]
+        nearest = nearest[np.argsort(distances[nearest], kind="stable")]
+        return [
+            {
+                "uuid": str(self.uuids[i]),
+                "title": str(self.titles[i]),
+                "distance": float(np.sqrt(max(distances[i], 0.0))),
+                "favorites": int(self.favorites[i]),
+                "views": int(self.views[i]),
+            }
+            for i in nearest
+        ]
+
+
+def load_or_build(snapshot_path, index_path=INDEX_FILE):
+    """Load the persisted index, rebuilding it only when the snapshot changed"""
+    fingerprint = _fingerprint(snapshot_path)
+    if os.path.exists(index_path):
+        index = SimilarityIndex.load(index_path)
+        if index.source == fingerprint:
+            return index
+
+    assets = iter_assets_from_file(snapshot_path, SKIP_FIELDS)
+    index = SimilarityIndex.build(assets, fingerprint)
+    index.save(index_path)
+    return index
+
+
+def main():
+    if len(sys.argv) < 3 or sys.argv[1] not in ("build", "query"):
+        print(__doc__)
+        return
+
+    index = load_or_build(sys.argv[2])
+    if sys.argv[1] == "build":
+        print(f"✅ Similarity index ready: {len(index.uuids)} assets in {INDEX_FILE}")
+        return
+
+    if len(sys.argv) < 4:
+        print("❌ Missing asset UUID")
+        return
+    uuid = sys.argv[3]
+    try:
+        results = index.query(uuid)
+    except KeyError as e:
+        print(f"❌ {e.args[0]}")
+        return
+
+    print(f"\n🎨 POSTS THAT LOOK LIKE {uuid}")
+    print("-" * 100)
+    print(f"{'#':<4} {'Title':<40} {'Distance':<10} {'❤️ Likes':<12} {'👁️ Views':<12}")
+    print("-" * 100)
+    for i, row in enumerate(results, 1):
+        print(
+            f"{i:<4} {row['title'][:38]:<40} {row['distance']:<10.3f} "
+            f"{row['favorites']:<12,} {row['views']:<12,}"
+        )
+    print("-" * 100)
+
+
+if __name__ == "__main__":
+    main()
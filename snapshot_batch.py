@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Parse and aggregate many snapshot files in parallel and print trend tables
+
+Usage:
+  python3 snapshot_batch.py snapshots/                 every snapshot in a directory
+  python3 snapshot_batch.py a.json b.json.gz c.metrics
+  python3 snapshot_batch.py --bench snapshots/         parallel vs serial timing
+
+Snapshots are ordered by capture time: a date in the file name
+(profile-2025-11-15.json, 20251115-0545.json.gz) if there is one, else the
+newest created_at / updated_at inside the snapshot, else the file's mtime
+(which copying or restoring a dump can change). Files that cannot be read
+are reported on stderr and left out.
+"""
+
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from asset_loader import HEAVY_FIELDS, iter_assets_from_file, parse_timestamp
+from binary_snapshot import BinarySnapshot, is_binary_snapshot, iter_snapshot_assets
+from top_k import DEFAULT_METRICS, aggregate
+
+SNAPSHOT_SUFFIXES = (".json", ".json.gz", ".metrics")
+
+# Side files that share a snapshot suffix (cache metadata, derived metrics)
+IGNORED_SUFFIXES = (".meta.json", ".derived.json")
+
+# YYYY-MM-DD or YYYYMMDD, optionally followed by HH:MM[:SS] / HHMM[SS]
+_NAME_TIME = re.compile(
+    r"(?<!\d)((?:19|20)\d\d)-?(\d\d)-?(\d\d)(?:[T_ -]?(\d\d)[:-]?(\d\d)(?:[:-]?(\d\d))?)?(?!\d)"
+)
+
+
+def find_snapshots(paths):
+    """Expand files and directories into a sorted list of snapshot files"""
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                if name.endswith(SNAPSHOT_SUFFIXES) and not name.endswith(IGNORED_SUFFIXES):
+                    found.append(os.path.join(path, name))
+        else:
+            found.append(path)
+    return found
+
+
+def iter_snapshot(path):
+    """Stream assets from a JSON, gzipped JSON or binary snapshot"""
+    if is_binary_snapshot(path):
+        return iter_snapshot_assets(path)
+    return iter_assets_from_file(path, skip_fields=HEAVY_FIELDS)
+
+
+def name_timestamp(path):
+    """Epoch seconds of a date (and time) in the file name, local time, or None"""
+    match = _NAME_TIME.search(os.path.basename(path))
+    if match is None:
+        return None
+    parts = [int(part) for part in match.groups(default="0")]
+    try:
+        return datetime(*parts).timestamp()
+    except ValueError:
+        return None
+
+
+def _track_timestamps(assets, latest):
+    """Pass assets through, keeping the newest created_at/updated_at in latest[0]"""
+    for asset in assets:
+        # ISO timestamps from one API compare correctly as strings
+        latest[0] = max(latest[0], asset.get("created_at") or "", asset.get("updated_at") or "")
+        yield asset
+
+
+def _content_timestamp(path, latest):
+    """Newest timestamp inside a snapshot (binary ones only store created_at)"""
+    if is_binary_snapshot(path):
+        with BinarySnapshot(path) as snapshot:
+            return float(max(snapshot.column("created_at"), default=0.0)) or None
+    return parse_timestamp(latest) or None
+
+
+def summarize_snapshot(path, top_n=5):
+    """
+    Reduce one snapshot to a small, picklable summary.
+
+    Runs inside a worker process: only totals and a few top entries cross the
+    process boundary, never the asset dicts themselves. A snapshot that
+    cannot be read comes back as {"path", "error"} instead of raising, so
+    one bad file does not stop the pool.
+    """
+    try:
+        latest = [""]
+        assets = iter_snapshot(path)
+        if not is_binary_snapshot(path):
+            assets = _track_timestamps(assets, latest)
+        stats = aggregate(assets, DEFAULT_METRICS, top_n)
+        captured_at = (
+            name_timestamp(path)
+            or _content_timestamp(path, latest[0])
+            or os.path.getmtime(path)
+        )
+    except Exception as e:
+        return {"path": path, "error": f"{type(e).__name__}: {e}"}
+    return {
+        "path": path,
+        "captured_at": captured_at,
+        "count": stats.count,
+        "totals": stats.totals,
+        "top": {
+            metric: [
+                (value, asset.get("uuid"), asset.get("title"))
+                for value, asset in stats.top_with_values(metric)
+            ]
+            for metric in ("favorites", "views")
+        },
+    }
+
+
+def analyze_snapshots(paths, workers=None, parallel=True):
+    """Summarize every snapshot, oldest first (parallel=False runs in-process)"""
+    if parallel and len(paths) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Large chunks keep the per-task IPC overhead negligible
+            chunksize = max(1, len(paths) // ((workers or os.cpu_count() or 1) * 4))
+            summaries = list(pool.map(summarize_snapshot, paths, chunksize=chunksize))
+    else:
+        summaries = [summarize_snapshot(path) for path in paths]
+
+    readable = []
+    for summary in summaries:
+        if "error" in summary:
+            print(f"❌ Skipping {summary['path']}: {summary['error']}", file=sys.stderr)
+        else:
+            readable.append(summary)
+    readable.sort(key=lambda s: s["captured_at"])
+    return readable
+
+
+def trend_rows(summaries):
+    """Merge summaries into trend rows with deltas against the previous snapshot"""
+    rows = []
+    previous = None
+    for summary in summaries:
+        row = {
+            "snapshot": os.path.basename(summary["path"]),
+            "captured_at": summary["captured_at"],
+            "posts": summary["count"],
+        }
+        for metric in DEFAULT_METRICS:
+            value = summary["totals"][metric]
+            row[metric] = value
+            row[f"{metric}_delta"] = value - previous["totals"][metric] if previous else 0
+        row["posts_delta"] = summary["count"] - previous["count"] if previous else 0
+        rows.append(row)
+        previous = summary
+    return rows
+
+
+def _with_delta(value, delta):
+    return f"{value:,} ({delta:+,})"
+
+
+def display_trends(summaries):
+    rows = trend_rows(summaries)
+    print("\n" + "=" * 110)
+    print(f"📈 TRENDS ACROSS {len(rows)} SNAPSHOTS")
+    print("=" * 110)
+    print(
+        f"{'Snapshot':<22} {'Captured':<17} {'Posts':<16} {'❤️ Likes':<18} "
+        f"{'👁️ Views':<18} {'⬇️ Downloads':<16}"
+    )
+    print("-" * 110)
+    for row in rows:
+        captured = time.strftime("%Y-%m-%d %H:%M", time.localtime(row["captured_at"]))
+        print(
+            f"{row['snapshot'][:20]:<22} {captured:<17} "
+            f"{_with_delta(row['posts'], row['posts_delta']):<16} "
+            f"{_with_delta(row['favorites'], row['favorites_delta']):<18} "
+            f"{_with_delta(row['views'], row['views_delta']):<18} "
+            f"{_with_delta(row['downloads'], row['downloads_delta']):<16}"
+        )
+    print("-" * 110)
+
+    if summaries:
+        latest = summaries[-1]
+        print(f"\n❤️  Most liked in latest snapshot ({os.path.basename(latest['path'])}):")
+        for value, uuid, title in latest["top"]["favorites"]:
+            print(f"   {value:>6,}  {(title or 'Untitled')[:48]:<50} {uuid}")
+
+
+def benchmark(paths, workers=None):
+    """Time the serial and the process-pool path over the same files"""
+    results = {}
+    for label, parallel in (("serial", False), ("parallel", True)):
+        started = time.perf_counter()
+        analyze_snapshots(paths, workers, parallel)
+        results[label] = time.perf_counter() - started
+        print(f"   {label:<9} {results[label]:8.2f}s")
+    print(f"   speedup   {results['serial'] / results['parallel']:8.2f}x on {os.cpu_count()} CPUs")
+    return results
+
+
+def main():
+    args = sys.argv[1:]
+    bench = "--bench" in args
+    args = [a for a in args if a != "--bench"]
+
+    paths = find_snapshots(args)
+    if not paths:
+        print(__doc__)
+        return
+
+    if bench:
+        print(f"\n⏱️  Benchmarking {len(paths)} snapshots")
+        benchmark(paths)
+        return
+
+    display_trends(analyze_snapshots(paths))
+
+
+if __name__ == "__main__":
+    main()
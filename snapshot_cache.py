@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Local on-disk cache of /published snapshots with TTL and conditional refresh
+
+cached_pages() fills the cache page by page while the assets stream on to
+the caller; a fetch that fails partway keeps the pages it has so the next
+run resumes at the failed offset. cached_fetch() downloads the catalog in a
+single request and revalidates it with ETag / Last-Modified.
+"""
+
+import gzip
+import itertools
+import json
+import os
+import sys
+import time
+
+import requests
+
+import instrumentation
+from asset_loader import CHUNK_SIZE, iter_assets, iter_assets_from_file, strip_fields
+
+CACHE_DIR = ".snapshot_cache"
+
+# Serve the cached snapshot without touching the network for this long (seconds)
+DEFAULT_TTL = 15 * 60
+
+
+def _cache_paths(username, cache_dir):
+    """Return (body_path, meta_path) for a username"""
+    safe_name = "".join(c for c in username if c.isalnum() or c in "-_.") or "_"
+    base = os.path.join(cache_dir, safe_name)
+    return base + ".json.gz", base + ".meta.json"
+
+
+def snapshot_path(username, cache_dir=CACHE_DIR):
+    """Path of the cached gzip snapshot for username (it may not exist yet)"""
+    return _cache_paths(username, cache_dir)[0]
+
+
+def read_meta(username, cache_dir=CACHE_DIR):
+    """Return cached metadata (fetched_at, etag, last_modified...) or None"""
+    body_path, meta_path = _cache_paths(username, cache_dir)
+    if not os.path.exists(body_path):
+        return None
+    meta = _read_meta_file(meta_path)
+    return meta if meta and "fetched_at" in meta else None
+
+
+def _read_meta_file(meta_path):
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_meta(meta_path, meta):
+    tmp_path = meta_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    os.replace(tmp_path, meta_path)
+
+
+def cached_fetch(username, url, headers, ttl=DEFAULT_TTL, cache_dir=CACHE_DIR):
+    """
+    Return the path of a gzip-compressed snapshot for username, refreshing it
+    from url when older than ttl.
+
+    Stale snapshots are revalidated with If-None-Match / If-Modified-Since, so
+    an unchanged profile costs a 304 instead of a full download. If the
+    network fails and a cached copy exists, the stale copy is used.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    body_path, meta_path = _cache_paths(username, cache_dir)
+    meta = read_meta(username, cache_dir)
+
+    if meta and meta.get("url") == url and time.time() - meta["fetched_at"] < ttl:
+        return body_path
+
+    request_headers = dict(headers)
+    if meta and meta.get("url") == url:
+        if meta.get("etag"):
+            request_headers["if-none-match"] = meta["etag"]
+        if meta.get("last_modified"):
+            request_headers["if-modified-since"] = meta["last_modified"]
+
+    try:
+        with instrumentation.stage("fetch"):
+            response = requests.get(url, headers=request_headers, stream=True)
+            if response.status_code == 304:
+                response.close()
+                meta["fetched_at"] = time.time()
+                _write_meta(meta_path, meta)
+                return body_path
+            response.raise_for_status()
+
+            # Download to a temp file first so a failed transfer never clobbers the cache
+            tmp_path = body_path + ".tmp"
+            with gzip.open(tmp_path, "wb", compresslevel=6) as f:
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    instrumentation.count("bytes_fetched", len(chunk))
+                    f.write(chunk)
+            os.replace(tmp_path, body_path)
+
+        _write_meta(
+            meta_path,
+            {
+                "url": url,
+                "fetched_at": time.time(),
+                "etag": response.headers.get("etag"),
+                "last_modified": response.headers.get("last-modified"),
+            },
+        )
+        return body_path
+    except requests.exceptions.RequestException as e:
+        if meta:
+            print(f"⚠️  API Error: {e} - using cached snapshot", file=sys.stderr)
+            return body_path
+        raise
+
+
+
+def _iter_partial(part_path, skip_fields):
+    """Assets of an interrupted download (its closing brackets were never written)"""
+    with gzip.open(part_path, "rb") as f:
+        chunks = itertools.chain(iter(lambda: f.read(CHUNK_SIZE), b""), [b"]}"])
+        yield from iter_assets(chunks, skip_fields)
+
+
+def cached_pages(username, fetcher, ttl=DEFAULT_TTL, skip_fields=(), cache_dir=CACHE_DIR):
+    """
+    Yield a user's assets from a PageFetcher, saving every page to the cache.
+
+    A snapshot younger than ttl is served from disk without a request.
+    Otherwise each page is yielded as soon as it arrives and appended to a
+    gzip .part file that replaces the cached snapshot after the last page.
+    If a page fails for good, the pages so far are kept along with
+    fetcher.cursor, and the next call (within ttl) replays them and resumes
+    there. If the first page fails and a cached snapshot exists, it is
+    served instead. The fetcher should not strip fields itself, so the
+    cache keeps whole assets; skip_fields applies to the yielded ones.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    body_path, meta_path = _cache_paths(username, cache_dir)
+    part_path = body_path + ".part"
+    url = fetcher.catalog_url
+    meta = read_meta(username, cache_dir)
+
+    if meta and meta.get("url") == url and time.time() - meta["fetched_at"] < ttl:
+        yield from iter_assets_from_file(body_path, skip_fields)
+        return
+
+    saved = (_read_meta_file(meta_path) or {}).get("partial")
+    resuming = (
+        saved is not None
+        and saved.get("url") == url
+        and time.time() - saved["started_at"] < ttl
+        and os.path.exists(part_path)
+    )
+    if resuming:
+        print(f"   ⏩ Resuming @{username} at offset {saved['cursor']}", file=sys.stderr)
+        fetcher.cursor = saved["cursor"]
+        yield from _iter_partial(part_path, skip_fields)
+        started_at, separator = saved["started_at"], ","
+    else:
+        started_at, separator = time.time(), ""
+
+    pages = fetcher.iter_pages()
+    try:
+        page = next(pages, [])
+    except requests.exceptions.RequestException as e:
+        if meta and not resuming:
+            print(f"⚠️  API Error: {e} - using cached snapshot", file=sys.stderr)
+            yield from iter_assets_from_file(body_path, skip_fields)
+            return
+        raise
+
+    encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    # A new gzip member per run: appending resumes an interrupted download
+    with gzip.open(part_path, "at" if resuming else "wt", encoding="utf-8") as f:
+        if not resuming:
+            f.write('{"assets":[')
+        try:
+            for page in itertools.chain([page], pages):
+                if not page:
+                    continue
+                f.write(separator + ",".join(encode(asset) for asset in page))
+                separator = ","
+                for asset in page:
+                    if skip_fields:
+                        strip_fields(asset, skip_fields)
+                    yield asset
+        except requests.exceptions.RequestException:
+            partial = {"url": url, "cursor": fetcher.cursor, "started_at": started_at}
+            _write_meta(meta_path, {**(meta or {}), "partial": partial})
+            print(
+                f"💾 Kept @{username} up to offset {fetcher.cursor}; "
+                "run again to resume from there",
+                file=sys.stderr,
+            )
+            raise
+        f.write('],"status":"success"}')
+    os.replace(part_path, body_path)
+    _write_meta(meta_path, {"url": url, "fetched_at": time.time()})
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Diff two snapshots: new posts, removed or unpublished posts, metric changes
+
+Two join strategies produce the same change set:
+  hash   stream the new snapshot against a uuid -> counters dict built from
+         the old one; memory grows with the old snapshot's asset count only
+  merge  external sort of both snapshots by uuid into sorted run files,
+         then a single merge-join pass; memory is bounded by RUN_SIZE rows
+
+Only uuid, title and the four counters of each asset are kept, never the
+full asset dicts. Snapshots can be JSON, gzipped JSON or binary.
+
+Usage:
+  python3 snapshot_diff.py old.json new.json
+  python3 snapshot_diff.py old.json new.json --merge --format csv --save changes.json
+"""
+
+import argparse
+import heapq
+import json
+import os
+import tempfile
+
+from binary_snapshot import is_binary_snapshot, snapshot_files
+from report_render import FORMATS, render_report
+from snapshot_batch import iter_snapshot
+from top_k import DEFAULT_METRICS, aggregate
+
+# Rows per sorted run in the merge strategy
+RUN_SIZE = 200_000
+
+# Old snapshots larger than this on disk are diffed with the merge strategy
+HASH_JOIN_MAX_BYTES = 1024 * 1024 * 1024
+
+
+def _rows(path):
+    """Yield compact (uuid, title, favorites, views, downloads, bookmarks) rows"""
+    for asset in iter_snapshot(path):
+        uuid = asset.get("uuid")
+        if uuid is None:
+            continue
+        yield (uuid, asset.get("title") or "Untitled") + tuple(
+            asset.get(metric) or 0 for metric in DEFAULT_METRICS
+        )
+
+
+def _write_run(rows, tmp_dir):
+    fd, path = tempfile.mkstemp(suffix=".run", dir=tmp_dir)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+        f.writelines(dumps(row) + "\n" for row in rows)
+    return path
+
+
+def _read_run(path):
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            yield tuple(json.loads(line))
+
+
+def _sorted_rows(path, tmp_dir, run_size=RUN_SIZE):
+    """Rows of a snapshot in uuid order, spilling sorted runs to tmp_dir"""
+    runs = []
+    batch = []
+    for row in _rows(path):
+        batch.append(row)
+        if len(batch) >= run_size:
+            batch.sort()
+            runs.append(_write_run(batch, tmp_dir))
+            batch = []
+    batch.sort()
+
+    if not runs:
+        yield from batch
+        return
+    runs.append(_write_run(batch, tmp_dir))
+    yield from heapq.merge(*(_read_run(run) for run in runs))
+
+
+class _ChangeCollector:
+    """Accumulates the change set shared by both join strategies"""
+
+    def __init__(self, old_path, new_path, method):
+        self.changes = {
+            "old": old_path,
+            "new": new_path,
+            "method": method,
+            "old_count": 0,
+            "new_count": 0,
+            "added": [],
+            "removed": [],
+            "changed": [],
+            "totals": {f"{metric}_delta": 0 for metric in DEFAULT_METRICS},
+        }
+
+    @staticmethod
+    def _asset(row):
+        return dict(zip(("uuid", "title") + DEFAULT_METRICS, row))
+
+    def added(self, row):
+        self.changes["added"].append(self._asset(row))
+        for metric, value in zip(DEFAULT_METRICS, row[2:]):
+            self.changes["totals"][f"{metric}_delta"] += value
+
+    def removed(self, row):
+        self.changes["removed"].append(self._asset(row))
+        for metric, value in zip(DEFAULT_METRICS, row[2:]):
+            self.changes["totals"][f"{metric}_delta"] -= value
+
+    def matched(self, old_row, new_row):
+        if old_row[2:] == new_row[2:]:
+            return
+        asset = self._asset(new_row)
+        for metric, old_value, new_value in zip(DEFAULT_METRICS, old_row[2:], new_row[2:]):
+            asset[f"{metric}_delta"] = new_value - old_value
+            self.changes["totals"][f"{metric}_delta"] += new_value - old_value
+        self.changes["changed"].append(asset)
+
+
+def _hash_join(old_path, new_path):
+    collector = _ChangeCollector(old_path, new_path, "hash")
+    index = {}
+    for row in _rows(old_path):
+        index[row[0]] = row
+    collector.changes["old_count"] = len(index)
+
+    new_count = 0
+    for row in _rows(new_path):
+        new_count += 1
+        old_row = index.pop(row[0], None)
+        if old_row is None:
+            collector.added(row)
+        else:
+            collector.matched(old_row, row)
+    collector.changes["new_count"] = new_count
+
+    # Whatever was never probed is gone from the new snapshot
+    for row in index.values():
+        collector.removed(row)
+    return collector.changes
+
+
+def _merge_join(old_path, new_path, run_size=RUN_SIZE):
+    collector = _ChangeCollector(old_path, new_path, "merge")
+    old_count = new_count = 0
+
+    with tempfile.TemporaryDirectory(prefix="snapshot_diff_") as tmp_dir:
+        old_rows = _sorted_rows(old_path, tmp_dir, run_size)
+        new_rows = _sorted_rows(new_path, tmp_dir, run_size)
+        old_row = next(old_rows, None)
+        new_row = next(new_rows, None)
+
+        while old_row is not None or new_row is not None:
+            if new_row is None or (old_row is not None and old_row[0] < new_row[0]):
+                collector.removed(old_row)
+                old_count += 1
+                old_row = next(old_rows, None)
+            elif old_row is None or new_row[0] < old_row[0]:
+                collector.added(new_row)
+                new_count += 1
+                new_row = next(new_rows, None)
+            else:
+                collector.matched(old_row, new_row)
+                old_count += 1
+                new_count += 1
+                old_row = next(old_rows, None)
+                new_row = next(new_rows, None)
+
+    collector.changes["old_count"] = old_count
+    collector.changes["new_count"] = new_count
+    return collector.changes
+
+
+def diff_snapshots(old_path, new_path, method="auto", run_size=RUN_SIZE):
+    """
+    Compare two snapshots and return a change set dict.
+
+    {"old", "new", "method", "old_count", "new_count",
+     "added": [asset], "removed": [asset],
+     "changed": [asset with new counters and <metric>_delta fields],
+     "totals": {"<metric>_delta": net change}}
+
+    method is "hash", "merge" or "auto" (merge only for very large old
+    snapshots). Hash output keeps snapshot order, merge output is in uuid order.
+    """
+    if method == "auto":
+        # Binary snapshots are usually named by their base name, sized by .metrics
+        sized_path = snapshot_files(old_path)[0] if is_binary_snapshot(old_path) else old_path
+        method = "merge" if os.path.getsize(sized_path) > HASH_JOIN_MAX_BYTES else "hash"
+    if method == "hash":
+        return _hash_join(old_path, new_path)
+    if method == "merge":
+        return _merge_join(old_path, new_path, run_size)
+    raise ValueError(f"Unknown diff method '{method}', expected hash, merge or auto")
+
+
+def change_report(changes, top_n=10):
+    """Turn a change set into a report dict for report_render"""
+    old_name = os.path.basename(changes["old"])
+    new_name = os.path.basename(changes["new"])
+
+    added = aggregate(changes["added"], ("favorites",), top_n).top("favorites")
+    removed = aggregate(changes["removed"], ("favorites",), top_n).top("favorites")
+    # Only real gains: a post whose views moved but likes did not is no like gain
+    like_gains = [asset for asset in changes["changed"] if asset["favorites_delta"] > 0]
+    view_gains = [asset for asset in changes["changed"] if asset["views_delta"] > 0]
+
+    return {
+        "username": f"{old_name} → {new_name}",
+        "title": f"🔀 SNAPSHOT DIFF: {old_name} → {new_name}",
+        "summary_title": "📈 CHANGES",
+        "summary_labels": {
+            "old_posts": f"Posts in {old_name}",
+            "posts": f"Posts in {new_name}",
+            "added": "New posts",
+            "removed": "Removed posts",
+            "changed": "Posts with changed metrics",
+        },
+        "summary": {
+            "old_posts": changes["old_count"],
+            "posts": changes["new_count"],
+            "added": len(changes["added"]),
+            "removed": len(changes["removed"]),
+            "changed": len(changes["changed"]),
+        },
+        "sections": [
+            {
+                "name": "new_posts",
+                "heading": f"🆕  NEW POSTS ({len(changes['added'])})",
+                "columns": ("favorites", "views"),
+                "rows": added,
+            },
+            {
+                "name": "removed_posts",
+                "heading": f"🗑️  REMOVED OR UNPUBLISHED POSTS ({len(changes['removed'])})",
+                "columns": ("favorites", "views"),
+                "rows": removed,
+            },
+            {
+                "name": "most_likes_gained",
+                "heading": f"❤️  TOP {top_n} LIKE GAINS",
+                "columns": ("favorites_delta", "favorites"),
+                "rows": aggregate(like_gains, ("favorites_delta",), top_n).top(
+                    "favorites_delta"
+                ),
+            },
+            {
+                "name": "most_views_gained",
+                "heading": f"👁️  TOP {top_n} VIEW GAINS",
+                "columns": ("views_delta", "views"),
+                "rows": aggregate(view_gains, ("views_delta",), top_n).top("views_delta"),
+            },
+        ],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Diff two asset snapshots")
+    parser.add_argument("old", help="older snapshot (JSON, .json.gz or binary)")
+    parser.add_argument("new", help="newer snapshot")
+    parser.add_argument("--merge", action="store_true", help="force the sorted-merge join")
+    parser.add_argument("--top", type=int, default=10, help="rows per section (default 10)")
+    parser.add_argument("--format", choices=FORMATS, default="table", dest="fmt")
+    parser.add_argument("--save", help="also write the full change set as JSON")
+    args = parser.parse_args()
+
+    changes = diff_snapshots(args.old, args.new, "merge" if args.merge else "auto")
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(changes, f, ensure_ascii=False)
+    render_report(change_report(changes, args.top), args.fmt)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for GET /v1/user/{username}/published, for offline load tests
+
+Serves data.json-shaped payloads with configurable catalog size, latency,
+pagination and gzip compression. Every asset is encoded once at startup, so
+a page costs a slice, a join and (optionally) one gzip call per request.
+Pages carry an ETag and Last-Modified, and conditional requests get a 304,
+so snapshot_cache revalidation can be exercised too.
+
+Usage:
+  python3 stand_in_api.py                          serve data.json's assets
+  python3 stand_in_api.py --size 100000 --latency 150 --gzip
+  python3 stand_in_api.py --size 50000 --max-page 500 --skip-heavy
+
+Then point the analytics path at it:
+  IMAGINE_API_BASE=http://127.0.0.1:8765/v1 python3 profile_stats.py someone
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import sys
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from asset_loader import HEAVY_FIELDS, iter_assets_from_file, strip_fields
+
+DEFAULT_PORT = 8765
+
+# limit used when a request does not send one
+DEFAULT_LIMIT = 3000
+
+
+class Catalog:
+    """Pre-encoded assets plus the response settings shared by every request"""
+
+    def __init__(self, encoded, latency=0.0, max_page=None, compress=False, compress_level=6):
+        self.encoded = encoded
+        self.latency = latency
+        self.max_page = max_page
+        self.compress = compress
+        self.compress_level = compress_level
+        self.version = hashlib.sha1(b"\n".join(encoded)).hexdigest()[:16]
+        self.last_modified = formatdate(time.time(), usegmt=True)
+        self.requests = 0
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_assets(cls, assets, skip_fields=(), **settings):
+        encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+        encoded = []
+        for asset in assets:
+            if skip_fields:
+                strip_fields(asset, skip_fields)
+            encoded.append(encode(asset).encode("utf-8"))
+        return cls(encoded, **settings)
+
+    def page(self, limit, offset):
+        """Body of one page, shaped like the real endpoint's response"""
+        if self.max_page:
+            limit = min(limit, self.max_page)
+        assets = self.encoded[offset : offset + limit]
+        return b'{"assets":[' + b",".join(assets) + b'],"status":"success"}'
+
+    def etag(self, limit, offset):
+        return f'"{self.version}-{limit}-{offset}"'
+
+    def record(self, sent):
+        with self._lock:
+            self.requests += 1
+            self.bytes_sent += sent
+
+
+class PublishedHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    catalog = None
+    verbose = False
+
+    def _query_int(self, query, name, default):
+        try:
+            return max(0, int(query[name][0]))
+        except (KeyError, ValueError):
+            return default
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if not url.path.rstrip("/").endswith("/published"):
+            self.send_error(404, "Only /user/{username}/published is served")
+            return
+
+        query = parse_qs(url.query)
+        limit = self._query_int(query, "limit", DEFAULT_LIMIT)
+        offset = self._query_int(query, "offset", 0)
+        catalog = self.catalog
+
+        if catalog.latency:
+            time.sleep(catalog.latency)
+
+        etag = catalog.etag(limit, offset)
+        if self.headers.get("if-none-match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            catalog.record(0)
+            return
+
+        body = catalog.page(limit, offset)
+        gzipped = catalog.compress and "gzip" in self.headers.get("accept-encoding", "")
+        if gzipped:
+            body = gzip.compress(body, catalog.compress_level)
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", catalog.last_modified)
+        self.send_header("Vary", "Accept-Encoding")
+        if gzipped:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        self.wfile.write(body)
+        catalog.record(len(body))
+
+    def log_message(self, format, *args):
+        if self.verbose:
+            sys.stderr.write(f"   {self.address_string()} {format % args}\n")
+
+
+def make_server(catalog, host="127.0.0.1", port=DEFAULT_PORT, verbose=False):
+    """Build (but do not start) a threaded server for catalog; port 0 picks a free one"""
+    handler = type("Handler", (PublishedHandler,), {"catalog": catalog, "verbose": verbose})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--snapshot", default="data.json", help="assets to serve or clone")
+    parser.add_argument("--size", type=int, help="serve this many synthetic assets")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0, help="ms before each response")
+    parser.add_argument("--max-page", type=int, help="cap on assets per response")
+    parser.add_argument("--gzip", action="store_true", help="gzip when the client accepts it")
+    parser.add_argument("--gzip-level", type=int, default=6)
+    parser.add_argument(
+        "--skip-heavy", action="store_true", help="drop prompts/metadata to save memory"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args()
+
+    if args.size is not None:
+        from benchmark import iter_synthetic_assets
+
+        assets = iter_synthetic_assets(args.size, args.snapshot, args.seed)
+    else:
+        assets = iter_assets_from_file(args.snapshot)
+
+    started = time.perf_counter()
+    catalog = Catalog.from_assets(
+        assets,
+        HEAVY_FIELDS if args.skip_heavy else (),
+        latency=args.latency / 1000,
+        max_page=args.max_page,
+        compress=args.gzip,
+        compress_level=args.gzip_level,
+    )
+    size = sum(len(asset) for asset in catalog.encoded)
+    print(
+        f"📦 {len(catalog.encoded):,} assets ({size / 1024 / 1024:,.1f} MB) "
+        f"encoded in {time.perf_counter() - started:.1f}s"
+    )
+
+    server = make_server(catalog, args.host, args.port, args.verbose)
+    host, port = server.server_address[:2]
+    print(f"🚀 Serving http://{host}:{port}/v1/user/<username>/published")
+    print(f"   IMAGINE_API_BASE=http://{host}:{port}/v1")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(
+            f"\n📊 {catalog.requests:,} requests, "
+            f"{catalog.bytes_sent / 1024 / 1024:,.1f} MB sent"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Single-pass top-k rankings and totals over published assets
+"""
+
+import heapq
+
+DEFAULT_METRICS = ("favorites", "views", "downloads", "bookmarks")
+
+
+def _field_getter(name):
+    """Default metric key: read a numeric field straight off the asset"""
+    return lambda asset: asset.get(name, 0) or 0
+
+
+class TopK:
+    """
+    Keep the N best assets for several metrics plus running totals in one scan.
+
+    Each metric has a bounded min-heap of size top_n, so feeding n assets costs
+    O(n log k) per metric instead of a full O(n log n) sort per ranking.
+    `keys` maps a metric name to a function computing it from an asset; metrics
+    without an entry are read as plain fields.
+    """
+
+    def __init__(self, metrics=DEFAULT_METRICS, top_n=10, keys=None):
+        keys = keys or {}
+        self.metrics = tuple(metrics)
+        self.top_n = top_n
+        self.count = 0
+        self.totals = {metric: 0 for metric in self.metrics}
+        self._keys = [(m, keys.get(m) or _field_getter(m)) for m in self.metrics]
+        self._heaps = {metric: [] for metric in self.metrics}
+
+    def add(self, asset):
+        """Feed one asset into every ranking and total"""
+        self.count += 1
+        # Negative sequence number keeps ties in input order, like a stable sort
+        seq = -self.count
+
+        for metric, key in self._keys:
+            value = key(asset)
+            self.totals[metric] += value
+
+            if self.top_n <= 0:
+                continue
+            heap = self._heaps[metric]
+            if len(heap) < self.top_n:
+                heapq.heappush(heap, (value, seq, asset))
+            elif (value, seq) > heap[0][:2]:
+                heapq.heapreplace(heap, (value, seq, asset))
+
+    def update(self, assets):
+        """Feed every asset from an iterable (list, generator, stream...)"""
+        add = self.add
+        for asset in assets:
+            add(asset)
+        return self
+
+    def top(self, metric):
+        """Return the top assets for a metric, best first"""
+        return [entry[2] for entry in sorted(self._heaps[metric], reverse=True)]
+
+    def top_with_values(self, metric):
+        """Return (value, asset) pairs for a metric, best first"""
+        return [
+            (entry[0], entry[2]) for entry in sorted(self._heaps[metric], reverse=True)
+        ]
+
+
+def aggregate(assets, metrics=DEFAULT_METRICS, top_n=10, keys=None):
+    """Build a TopK from an iterable of assets in a single pass"""
+    return TopK(metrics, top_n, keys).update(assets)